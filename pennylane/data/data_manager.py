@@ -17,21 +17,69 @@ Contains the Dataset utility functions.
 # pylint:disable=too-many-arguments,global-statement
 from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from contextlib import suppress
 import os
 from os.path import sep as pathsep
-from time import sleep
+import threading
 from urllib.parse import quote
+from uuid import uuid4
 
+from appdirs import user_cache_dir
 import requests
-from pennylane.data.dataset import Dataset
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pennylane.data.dataset import Dataset, _import_zstd_dill
+
+try:
+    # orjson parses the large foldermap and data struct considerably faster, if available
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
 
 S3_URL = "https://xanadu-quantum-datasets.s3.amazonaws.com"
 FOLDERMAP_URL = f"{S3_URL}/foldermap.json"
 DATA_STRUCT_URL = f"{S3_URL}/data_struct.json"
 
+# Size of the chunks in which downloaded files are written to disk
+_CHUNK_SIZE = 1 << 20
+
+# Directory in which the foldermap and data struct are cached between sessions
+_cache_dir = os.path.join(user_cache_dir("pennylane", "Xanadu"), "datasets")
+
 _foldermap = {}
 _data_struct = {}
 
+# Folders resolved by ``_resolve_folders``, along with the foldermap they were resolved from
+_resolved_folders = {}
+_resolved_foldermap = None
+_RESOLVED_FOLDERS_SIZE = 512
+
+# Held while fetching the foldermap or data struct, so concurrent calls only fetch them once
+_foldermap_lock = threading.Lock()
+_data_struct_lock = threading.Lock()
+
+# All requests go to the same host, so share one session to reuse keep-alive connections
+_session = requests.Session()
+_session_pool_size = 0
+
+
+def _resize_session_pool(pool_size):
+    """Mount a connection-pooling adapter on the shared session if the current pool cannot
+    hold ``pool_size`` simultaneous connections."""
+    global _session_pool_size
+    if pool_size <= _session_pool_size:
+        return
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    _session.mount("https://", adapter)
+    _session_pool_size = pool_size
+
+
+_resize_session_pool(50)
+
 
 # pylint:disable=too-many-branches
 def _format_details(param, details):
@@ -116,14 +164,74 @@ def _validate_params(data_name, description, attributes):
         raise exc  # pylint:disable=raising-bad-type
 
 
+def _partial_path(path):
+    """Return a unique temporary path next to ``path``, so that concurrent writers of the same
+    file, in separate threads or processes, never write into the same temporary file."""
+    return f"{path}.{uuid4().hex}.part"
+
+
+def _write_atomic(path, content):
+    """Write ``content`` to ``path`` such that readers never see a partially written file."""
+    partial = _partial_path(path)
+    try:
+        with open(partial, "wb") as f:
+            f.write(content)
+        os.replace(partial, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(partial)
+        raise
+
+
+def _fetch_json(url, filename):
+    """Fetch a JSON file from S3, using a copy cached on disk if it is still up-to-date.
+
+    The cached copy is stored as ``filename`` in the cache directory, alongside the ETag of the
+    response it came from. The ETag is sent with the request, so that the server only returns
+    the full file if it has changed since it was cached.
+
+    Args:
+        url (str): The URL of the JSON file
+        filename (str): The name under which the file is cached
+
+    Returns:
+        Any: the parsed JSON content
+    """
+    path = os.path.join(_cache_dir, filename)
+    etag_path = f"{path}.etag"
+
+    headers = {}
+    if os.path.exists(path) and os.path.exists(etag_path):
+        with open(etag_path, "r", encoding="utf-8") as f:
+            headers["If-None-Match"] = f.read()
+
+    response = _session.get(url, headers=headers, timeout=5.0)
+    if response.status_code == 304:
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
+    response.raise_for_status()
+    content = _json_loads(response.content)
+
+    etag = response.headers.get("ETag")
+    if etag:
+        try:
+            os.makedirs(_cache_dir, exist_ok=True)
+            _write_atomic(path, response.content)
+            _write_atomic(etag_path, etag.encode("utf-8"))
+        except OSError:
+            # an unwritable cache only means the file is downloaded again next session
+            pass
+    return content
+
+
 def _refresh_foldermap():
     """Refresh the foldermap from S3."""
     global _foldermap
     if _foldermap:
         return
-    response = requests.get(FOLDERMAP_URL, timeout=5.0)
-    response.raise_for_status()
-    _foldermap = response.json()
+    with _foldermap_lock:
+        if not _foldermap:
+            _foldermap = _fetch_json(FOLDERMAP_URL, "foldermap.json")
 
 
 def _refresh_data_struct():
@@ -131,18 +239,61 @@ def _refresh_data_struct():
     global _data_struct
     if _data_struct:
         return
-    response = requests.get(DATA_STRUCT_URL, timeout=5.0)
-    response.raise_for_status()
-    _data_struct = response.json()
+    with _data_struct_lock:
+        if not _data_struct:
+            _data_struct = _fetch_json(DATA_STRUCT_URL, "data_struct.json")
 
 
 def _fetch_and_save(filename, dest_folder):
-    """Download a single file from S3 and save it locally."""
+    """Download a single file from S3 and save it locally.
+
+    The response is streamed in chunks to a uniquely named temporary ``.part`` file, which is
+    only moved to its final location once the download completes. This bounds the memory used
+    per download, and ensures an interrupted or concurrent download is never mistaken for a
+    complete file.
+    """
     webfile = filename if pathsep == "/" else filename.replace(pathsep, "/")
-    response = requests.get(f"{S3_URL}/{quote(webfile)}", timeout=5.0)
-    response.raise_for_status()
-    with open(os.path.join(dest_folder, filename), "wb") as f:
-        f.write(response.content)
+    dest = os.path.join(dest_folder, filename)
+    partial = _partial_path(dest)
+    try:
+        with _session.get(f"{S3_URL}/{quote(webfile)}", timeout=5.0, stream=True) as response:
+            response.raise_for_status()
+            with open(partial, "wb") as f:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    f.write(chunk)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, dest)
+
+
+def _missing_files(files, dest_folder):
+    """Return the files that are not present in the destination folder yet.
+
+    Each folder is listed once, rather than checking for the existence of every file.
+
+    Args:
+        files (list[str]): Paths of files relative to ``dest_folder``
+        dest_folder (str): Path to the root folder where files are saved
+
+    Returns:
+        list[str]: The files from ``files`` that do not exist locally
+    """
+    files_by_folder = {}
+    for f in files:
+        files_by_folder.setdefault(os.path.dirname(f), []).append(f)
+
+    missing = []
+    for folder, folder_files in files_by_folder.items():
+        try:
+            with os.scandir(os.path.join(dest_folder, folder)) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            missing.extend(folder_files)
+            continue
+        missing.extend(f for f in folder_files if os.path.basename(f) not in existing)
+    return missing
 
 
 def _s3_download(data_name, folders, attributes, dest_folder, force, num_threads):
@@ -159,33 +310,35 @@ def _s3_download(data_name, folders, attributes, dest_folder, force, num_threads
     """
     files = []
     for folder in folders:
-        local_folder = os.path.join(dest_folder, data_name, folder)
-        if not os.path.exists(local_folder):
-            os.makedirs(local_folder)
-
         prefix = os.path.join(data_name, folder, f"{folder.replace(pathsep, '_')}_")
         # TODO: consider combining files within a folder (switch to append)
         files.extend([f"{prefix}{attr}.dat" for attr in attributes])
 
+    files = list(dict.fromkeys(files))
     if not force:
-        start = len(dest_folder.rstrip(pathsep)) + 1
-        existing_files = {
-            os.path.join(path, name)[start:]
-            for path, _, local_files in os.walk(dest_folder)
-            for name in local_files
-        }
-        files = list(set(files) - existing_files)
+        files = _missing_files(files, dest_folder)
+
+    # only create the folders that will receive files, once per folder
+    for local_folder in {os.path.dirname(f) for f in files}:
+        os.makedirs(os.path.join(dest_folder, local_folder), exist_ok=True)
 
+    _resize_session_pool(num_threads)
     with ThreadPoolExecutor(num_threads) as pool:
         futures = [pool.submit(_fetch_and_save, f, dest_folder) for f in files]
         results = wait(futures, return_when=FIRST_EXCEPTION)
+        # abort downloads that have not started yet instead of letting them run after a failure
+        for future in results.not_done:
+            future.cancel()
         for result in results.done:
             if result.exception():
                 raise result.exception()
 
 
 def _generate_folders(node, folders):
-    """Recursively generate and return a tree of all folder names below a node.
+    """Generate and return a tree of all folder names below a node.
+
+    The tree is expanded one level at a time, keeping each folder as a tuple of names that
+    is only joined into a path once all of its levels are known.
 
     Args:
         node (dict) : A sub-dict of the foldermap for which a list of sub-folders is generated
@@ -195,22 +348,60 @@ def _generate_folders(node, folders):
     Returns:
         list[str]: The paths of files that should be fetched from S3
     """
+    level = [((), node)]
+    for requested in folders:
+        next_level = []
+        for path, sub_node in level:
+            # the last level of the foldermap is a list, so use a set for membership checks
+            available = sub_node if isinstance(sub_node, dict) else set(sub_node)
+            names = sub_node if requested == ["full"] else [f for f in requested if f in available]
+            for name in names:
+                child = sub_node[name] if isinstance(sub_node, dict) else None
+                next_level.append(((*path, name), child))
+        level = next_level
+    return [os.path.join(*path) for path, _ in level]
+
+
+def _preload_zstd_dill():
+    """Start importing zstd and dill in a background thread if they have not been imported yet,
+    so that the import overlaps with the network requests made before any file is read."""
+    if _import_zstd_dill.cache_info().currsize:
+        return
 
-    next_folders = folders[1:]
-    if folders[0] == ["full"]:
-        folders = node
-    else:
-        values_for_this_node = set(folders[0]).intersection(set(node))
-        folders = [f for f in folders[0] if f in values_for_this_node]
-    return (
-        [
-            os.path.join(folder, child)
-            for folder in folders
-            for child in _generate_folders(node[folder], next_folders)
-        ]
-        if next_folders
-        else folders
-    )
+    def _import():
+        # a missing module is reported when a file is first read or written
+        with suppress(ImportError):
+            _import_zstd_dill()
+
+    threading.Thread(target=_import, daemon=True).start()
+
+
+def _resolve_folders(data_name, folders):
+    """Generate the folders of ``data_name`` requested by ``folders``.
+
+    The foldermap is only fetched once per session, so the result is cached to avoid walking
+    the foldermap again when the same datasets are loaded repeatedly. The cache is discarded
+    whenever ``_foldermap`` is replaced.
+
+    Args:
+        data_name (str): The type of the data required
+        folders (tuple[tuple[str]]): The ordered folder names requested, as passed to
+            :func:`~._generate_folders`
+
+    Returns:
+        tuple[str]: The paths of files that should be fetched from S3
+    """
+    global _resolved_foldermap
+    if _resolved_foldermap is not _foldermap or len(_resolved_folders) >= _RESOLVED_FOLDERS_SIZE:
+        _resolved_folders.clear()
+        _resolved_foldermap = _foldermap
+
+    key = (data_name, folders)
+    if key not in _resolved_folders:
+        _resolved_folders[key] = tuple(
+            _generate_folders(_foldermap[data_name], [list(f) for f in folders])
+        )
+    return _resolved_folders[key]
 
 
 def load(
@@ -244,6 +435,7 @@ def load(
 
     _ = lazy
 
+    _preload_zstd_dill()
     _refresh_foldermap()
     _refresh_data_struct()
     if not attributes:
@@ -260,19 +452,21 @@ def load(
     data = _data_struct[data_name]
     directory_path = os.path.join(folder_path, "datasets")
 
-    folders = [description[param] for param in data["params"]]
-    all_folders = _generate_folders(_foldermap[data_name], folders)
+    folders = tuple(tuple(description[param]) for param in data["params"])
+    all_folders = _resolve_folders(data_name, folders)
     _s3_download(data_name, all_folders, attributes, directory_path, force, num_threads)
 
-    data_files = []
     docstring = data["docstr"]
-    for folder in all_folders:
+
+    def _open_dataset(folder):
         real_folder = os.path.join(directory_path, data_name, folder)
-        data_files.append(
-            Dataset(data_name, real_folder, folder.replace(pathsep, "_"), docstring, standard=True)
+        return Dataset(
+            data_name, real_folder, folder.replace(pathsep, "_"), docstring, standard=True
         )
 
-    return data_files
+    # opening a dataset reads from disk, so open them concurrently rather than one by one
+    with ThreadPoolExecutor(num_threads) as pool:
+        return list(pool.map(_open_dataset, all_folders))
 
 
 def _direc_to_dict(path):
@@ -337,6 +531,31 @@ def list_attributes(data_name):
     return _data_struct[data_name]["attributes"]
 
 
+def _interactive_choose(options, multiple=False):
+    """Read the user's choice of one or several of the listed options from the input.
+
+    Args:
+        options (list[str]): The options that were listed to the user, numbered from 1
+        multiple (bool): Whether a comma-separated list of options may be entered
+
+    Returns:
+        list[str]: The chosen options
+    """
+    if multiple:
+        raw = input(f"Choice (comma-separated list of options) [1-{len(options)}]: ")
+        error = f"Must enter a list of integers between 1 and {len(options)}"
+    else:
+        raw = input(f"Choice [1-{len(options)}]: ")
+        error = f"Must enter an integer between 1 and {len(options)}"
+    try:
+        choices = [int(choice) for choice in raw.split(",")] if multiple else [int(raw)]
+    except ValueError as e:
+        raise ValueError(error) from e
+    if not all(1 <= choice <= len(options) for choice in choices):
+        raise ValueError(error)
+    return [options[choice - 1] for choice in choices]
+
+
 def _interactive_request_attributes(options):
     """Prompt the user to select a list of attributes."""
     prompt = "Please select attributes:"
@@ -345,14 +564,7 @@ def _interactive_request_attributes(options):
             option = "full (all attributes)"
         prompt += f"\n\t{i+1}) {option}"
     print(prompt)
-    choices = input(f"Choice (comma-separated list of options) [1-{len(options)}]: ").split(",")
-    try:
-        choices = list(map(int, choices))
-    except ValueError as e:
-        raise ValueError(f"Must enter a list of integers between 1 and {len(options)}") from e
-    if any(choice < 1 or choice > len(options) for choice in choices):
-        raise ValueError(f"Must enter a list of integers between 1 and {len(options)}")
-    return [options[choice - 1] for choice in choices]
+    return _interactive_choose(options, multiple=True)
 
 
 def _interactive_request_single(node, param):
@@ -360,17 +572,10 @@ def _interactive_request_single(node, param):
     options = list(node)
     if len(options) == 1:
         print(f"Using {options[0]} as it is the only {param} available.")
-        sleep(1)
         return options[0]
     print(f"Please select a {param}:")
     print("\n".join(f"\t{i+1}) {option}" for i, option in enumerate(options)))
-    try:
-        choice = int(input(f"Choice [1-{len(options)}]: "))
-    except ValueError as e:
-        raise ValueError(f"Must enter an integer between 1 and {len(options)}") from e
-    if choice < 1 or choice > len(options):
-        raise ValueError(f"Must enter an integer between 1 and {len(options)}")
-    return options[choice - 1]
+    return _interactive_choose(options)[0]
 
 
 def load_interactive():
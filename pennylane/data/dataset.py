@@ -16,6 +16,7 @@ Contains the :class:`~pennylane.data.Dataset` class and its associated functions
 """
 
 from abc import ABC
+from functools import lru_cache
 from glob import glob
 import os
 
@@ -25,8 +26,9 @@ from pennylane.pauli import string_to_pauli_word, pauli_word_to_string
 condensed_hamiltonians = {"hamiltonian", "tapered_hamiltonian"}
 
 
+@lru_cache(maxsize=1)
 def _import_zstd_dill():
-    """Import zstd and dill."""
+    """Import zstd and dill. The modules are cached after the first successful import."""
     try:
         # pylint: disable=import-outside-toplevel, unused-import, multiple-imports
         import zstd, dill
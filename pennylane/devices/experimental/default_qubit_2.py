@@ -15,15 +15,23 @@
 This module contains the next generation successor to default qubit
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Callable, Tuple, Optional, Sequence
 
 import pennylane.numpy as np
+from pennylane import DeviceError
+from pennylane.queuing import QueuingManager
 from pennylane.tape import QuantumTape, QuantumScript
 from pennylane.typing import Result, ResultBatch
 
 from . import Device
 from .execution_config import ExecutionConfig, DefaultExecutionConfig
-from ..qubit.simulate import simulate
+from ..qubit.simulate import (
+    simulate,
+    get_final_state,
+    measure_final_state,
+    _map_wires_to_integers,
+)
 from ..qubit.preprocess import preprocess, validate_and_expand_adjoint
 from ..qubit.adjoint_jacobian import adjoint_jacobian
 
@@ -94,6 +102,20 @@ class DefaultQubit2(Device):
     >>> jax.grad(f)(jax.numpy.array(1.2))
     DeviceArray(-0.93203914, dtype=float32, weak_type=True)
 
+    .. details::
+        :title: Device options
+
+        The following keys of ``ExecutionConfig.device_options`` are supported:
+
+        * ``max_workers``: If set to a positive integer, the states of the circuits in a batch
+          are evolved concurrently by a thread pool with at most this many workers. Wire mapping
+          and measurements still run on the calling thread, so results match a sequential
+          execution with the same seed. Circuits are executed in sequence if not provided, or if
+          a debugger is active.
+
+        >>> config = ExecutionConfig(device_options={"max_workers": 4})
+        >>> results = dev.execute(new_batch, execution_config=config)
+
     """
 
     @property
@@ -186,6 +208,12 @@ class DefaultQubit2(Device):
         circuits: QuantumTape_or_Batch,
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ) -> Result_or_ResultBatch:
+        max_workers = execution_config.device_options.get("max_workers")
+        if max_workers is not None and (
+            not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1
+        ):
+            raise DeviceError(f"max_workers must be a positive integer; got {max_workers!r}.")
+
         is_single_circuit = False
         if isinstance(circuits, QuantumScript):
             is_single_circuit = True
@@ -197,7 +225,19 @@ class DefaultQubit2(Device):
             self.tracker.update(batches=1, executions=len(circuits))
             self.tracker.record()
 
-        results = tuple(simulate(c, rng=self._rng, debugger=self._debugger) for c in circuits)
+        if max_workers is None or self._debugger is not None or len(circuits) == 1:
+            results = tuple(simulate(c, rng=self._rng, debugger=self._debugger) for c in circuits)
+        else:
+            # Queuing state is global to the process, so only the state evolution runs in the
+            # workers. Wire mapping and measurements construct operators and stay on this thread.
+            circuits = [_map_wires_to_integers(c) for c in circuits]
+            with QueuingManager.stop_recording(), ThreadPoolExecutor(max_workers) as executor:
+                final_states = tuple(executor.map(get_final_state, circuits))
+            results = tuple(
+                measure_final_state(c, state, is_state_batched, rng=self._rng)
+                for c, (state, is_state_batched) in zip(circuits, final_states)
+            )
+
         return results[0] if is_single_circuit else results
 
     def compute_derivatives(
@@ -221,3 +261,43 @@ class DefaultQubit2(Device):
         raise NotImplementedError(
             f"{self.name} cannot compute derivatives via {execution_config.gradient_method}"
         )
+
+    def execute_and_compute_derivatives(
+        self,
+        circuits: QuantumTape_or_Batch,
+        execution_config: ExecutionConfig = DefaultExecutionConfig,
+    ):
+        is_single_circuit = False
+        if isinstance(circuits, QuantumScript):
+            is_single_circuit = True
+            circuits = [circuits]
+
+        if self.tracker.active:
+            for c in circuits:
+                self.tracker.update(resources=c.specs["resources"])
+            self.tracker.update(
+                batches=1,
+                executions=len(circuits),
+                derivative_batches=1,
+                derivatives=len(circuits),
+            )
+            self.tracker.record()
+
+        if execution_config.gradient_method == "adjoint":
+            results = tuple(
+                _adjoint_jac_wrapper(c, rng=self._rng, debugger=self._debugger) for c in circuits
+            )
+            results, jacs = tuple(zip(*results))
+            return (results[0], jacs[0]) if is_single_circuit else (results, jacs)
+
+        raise NotImplementedError(
+            f"{self.name} cannot compute derivatives via {execution_config.gradient_method}"
+        )
+
+
+def _adjoint_jac_wrapper(c, rng=None, debugger=None):
+    """Execute a circuit and compute its adjoint jacobian from a single forward pass."""
+    state, is_state_batched = get_final_state(c, debugger=debugger)
+    res = measure_final_state(c, state, is_state_batched, rng=rng)
+    jac = adjoint_jacobian(c, state=state)
+    return res, jac
@@ -14,14 +14,13 @@
 """
 This module contains the Abstract Base Class for the next generation of devices.
 """
-# pylint: disable=comparison-with-callable
 import abc
 
-from numbers import Number
+from functools import cached_property
 from typing import Callable, Union, Sequence, Tuple, Optional
 
 from pennylane.tape import QuantumTape, QuantumScript
-from pennylane.typing import Result, ResultBatch
+from pennylane.typing import Result, ResultBatch, TensorLike
 from pennylane import Tracker
 
 from .execution_config import ExecutionConfig, DefaultExecutionConfig
@@ -32,6 +31,21 @@ QuantumTape_or_Batch = Union[QuantumTape, QuantumTapeBatch]
 PostprocessingFn = Callable[[ResultBatch], Result_or_ResultBatch]
 
 
+def blank_postprocessing_fn(res: ResultBatch) -> ResultBatch:
+    """Identity postprocessing function returned by the default Device preprocessing.
+
+    It is defined once at module level, rather than on every call to :meth:`~.Device.preprocess`.
+
+    Args:
+        res (tensor-like): A result object
+
+    Returns:
+        tensor-like: The function input.
+
+    """
+    return res
+
+
 # pylint: disable=unused-argument, no-self-use
 class Device(abc.ABC):
     """A device driver that can control one or more backends. A backend can be either a physical
@@ -106,7 +120,20 @@ class Device(abc.ABC):
 
     """
 
-    @property
+    # Whether or not a subclass overrides the corresponding method, determined once per class
+    _overrides_compute_derivatives = False
+    _overrides_compute_jvp = False
+    _overrides_compute_vjp = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._overrides_compute_derivatives = (
+            cls.compute_derivatives is not Device.compute_derivatives
+        )
+        cls._overrides_compute_jvp = cls.compute_jvp is not Device.compute_jvp
+        cls._overrides_compute_vjp = cls.compute_vjp is not Device.compute_vjp
+
+    @cached_property
     def name(self) -> str:
         """The name of the device or set of devices.
 
@@ -116,7 +143,7 @@ class Device(abc.ABC):
         """
         return type(self).__name__
 
-    tracker: Tracker = Tracker()
+    tracker: Tracker
     """A :class:`~.Tracker` that can store information about device executions, shots, batches,
     intermediate results, or any additional device dependent information.
 
@@ -142,7 +169,7 @@ class Device(abc.ABC):
         self,
         circuits: QuantumTape_or_Batch,
         execution_config: ExecutionConfig = DefaultExecutionConfig,
-    ) -> Tuple[QuantumTapeBatch, PostprocessingFn, ExecutionConfig]:
+    ) -> Tuple[Tuple[QuantumTape, ...], PostprocessingFn, ExecutionConfig]:
         """Device preprocessing function.
 
         .. warning::
@@ -159,6 +186,7 @@ class Device(abc.ABC):
             execution_config (ExecutionConfig): A datastructure describing the parameters needed to fully describe
                 the execution.
 
+        Returns:
             Tuple[QuantumTape], Callable, ExecutionConfig: QuantumTapes that the device can natively execute,
             a postprocessing function to be called after execution, and a configuration with unset specifications filled in.
 
@@ -174,21 +202,12 @@ class Device(abc.ABC):
         * validation of configuration parameters
         * choosing a best gradient method and ``grad_on_execution`` value.
 
-        """
-
-        def blank_postprocessing_fn(res: ResultBatch) -> ResultBatch:
-            """Identity postprocessing function created in Device preprocessing.
+        The default implementation wraps a single circuit into a one-element tuple and converts any
+        other sequence of circuits into a tuple, so the batch can safely be iterated more than once.
+        A batch that is already a tuple is returned as is.
 
-            Args:
-                res (tensor-like): A result object
-
-            Returns:
-                tensor-like: The function input.
-
-            """
-            return res
-
-        circuit_batch = (circuits,) if isinstance(circuits, QuantumScript) else circuits
+        """
+        circuit_batch = (circuits,) if isinstance(circuits, QuantumScript) else tuple(circuits)
         return circuit_batch, blank_postprocessing_fn, execution_config
 
     @abc.abstractmethod
@@ -344,12 +363,12 @@ class Device(abc.ABC):
 
         """
         if execution_config is None:
-            return type(self).compute_derivatives != Device.compute_derivatives
+            return self._overrides_compute_derivatives
 
         if execution_config.gradient_method != "device" or execution_config.derivative_order != 1:
             return False
 
-        return type(self).compute_derivatives != Device.compute_derivatives
+        return self._overrides_compute_derivatives
 
     def compute_derivatives(
         self,
@@ -410,7 +429,7 @@ class Device(abc.ABC):
     def compute_jvp(
         self,
         circuits: QuantumTape_or_Batch,
-        tangents: Tuple[Number],
+        tangents: TensorLike,
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
         r"""The jacobian vector product used in forward mode calculation of derivatives.
@@ -440,8 +459,11 @@ class Device(abc.ABC):
 
         **Shape of tangents:**
 
-        The ``tangents`` tuple should be the same length as ``circuit.get_parameters()`` and have a single number per
+        The ``tangents`` should be the same length as ``circuit.get_parameters()`` and have a single number per
         parameter. If a number is zero, then the gradient with respect to that parameter does not need to be computed.
+        A one-dimensional array is preferred over a tuple of numbers, as it allows the product with the Jacobian
+        to be computed as a single vectorized operation. Devices should not convert the tangents to NumPy if they
+        need to remain differentiable by a machine learning interface.
 
         """
         raise NotImplementedError
@@ -449,7 +471,7 @@ class Device(abc.ABC):
     def execute_and_compute_jvp(
         self,
         circuits: QuantumTape_or_Batch,
-        tangents: Tuple[Number],
+        tangents: TensorLike,
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
         """Execute a batch of circuits and compute their jacobian vector products.
@@ -482,19 +504,19 @@ class Device(abc.ABC):
         Default behaviour assumes this to be ``True`` if :meth:`~.compute_jvp` is overridden.
 
         """
-        return type(self).compute_jvp != Device.compute_jvp
+        return self._overrides_compute_jvp
 
     def compute_vjp(
         self,
         circuits: QuantumTape_or_Batch,
-        cotangents: Tuple[Number],
+        cotangents: TensorLike,
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
         r"""The vector jacobian product used in reverse-mode differentiation.
 
         Args:
             circuits (Union[QuantumTape, Sequence[QuantumTape]]): the circuit or batch of circuits
-            cotangents (Tuple[Number]): Gradient-output vector. Must have shape matching the output shape of the
+            cotangents (tensor-like): Gradient-output vector. Must have shape matching the output shape of the
                 corresponding circuit
             execution_config (ExecutionConfig): a datastructure with all additional information required for execution
 
@@ -526,14 +548,14 @@ class Device(abc.ABC):
     def execute_and_compute_vjp(
         self,
         circuits: QuantumTape_or_Batch,
-        cotangents: Tuple[Number],
+        cotangents: TensorLike,
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
         r"""Calculate both the results and the vector jacobian product used in reverse-mode differentiation.
 
         Args:
             circuits (Union[QuantumTape, Sequence[QuantumTape]]): the circuit or batch of circuits to be executed
-            cotangents Tuple[Number]: Gradient-output vector. Must have shape matching the output shape of the
+            cotangents (tensor-like): Gradient-output vector. Must have shape matching the output shape of the
                 corresponding circuit
             execution_config (ExecutionConfig): a datastructure with all additional information required for execution
 
@@ -559,4 +581,4 @@ class Device(abc.ABC):
 
         Default behaviour assumes this to be ``True`` if :meth:`~.compute_vjp` is overridden.
         """
-        return type(self).compute_vjp != Device.compute_vjp
+        return self._overrides_compute_vjp
@@ -27,6 +27,8 @@ at your own discretion.
     sample_state
     preprocess
     simulate
+    get_final_state
+    measure_final_state
 """
 
 from .apply_operation import apply_operation
@@ -35,4 +37,4 @@ from .initialize_state import create_initial_state
 from .measure import measure
 from .preprocess import preprocess
 from .sampling import sample_state, measure_with_samples
-from .simulate import simulate
+from .simulate import simulate, get_final_state, measure_final_state
@@ -33,7 +33,7 @@ def _dot_product_real(bra, ket, num_wires):
     return qml.math.real(qml.math.sum(qml.math.conj(bra) * ket, axis=sum_axes))
 
 
-def adjoint_jacobian(tape: QuantumTape):  # pylint: disable=too-many-statements
+def adjoint_jacobian(tape: QuantumTape, state=None):  # pylint: disable=too-many-statements
     """Implements the adjoint method outlined in
     `Jones and Gacon <https://arxiv.org/abs/2009.02823>`__ to differentiate an input tape.
 
@@ -51,6 +51,8 @@ def adjoint_jacobian(tape: QuantumTape):  # pylint: disable=too-many-statements
 
     Args:
         tape (.QuantumTape): circuit that the function takes the gradient of
+        state (TensorLike): the final state of the circuit; if not provided,
+            the final state will be computed by executing the circuit
 
     Returns:
         array or tuple[array]: the derivative of the tape with respect to trainable parameters.
@@ -63,12 +65,15 @@ def adjoint_jacobian(tape: QuantumTape):  # pylint: disable=too-many-statements
         tape = qml.map_wires(tape, wire_map)
 
     # Initialization of state
-    prep_operation = None if len(tape._prep) == 0 else tape._prep[0]
-    ket = create_initial_state(
-        wires=tape.wires, prep_operation=prep_operation
-    )  #  ket(0) if prep_operation is None, else
-    for op in tape._ops:
-        ket = apply_operation(op, ket)
+    if state is not None:
+        ket = state
+    else:
+        prep_operation = None if len(tape._prep) == 0 else tape._prep[0]
+        ket = create_initial_state(
+            wires=tape.wires, prep_operation=prep_operation
+        )  #  ket(0) if prep_operation is None, else
+        for op in tape._ops:
+            ket = apply_operation(op, ket)
 
     n_obs = len(tape.observables)
     bras = np.empty([n_obs] + [2] * len(tape.wires), dtype=np.complex128)
@@ -300,7 +300,8 @@ def _update_config(config: ExecutionConfig) -> ExecutionConfig:
         config (ExecutionConfig): the initial execution config
 
     Returns:
-        ExecutionConfig: a new config with the best choices selected.
+        ExecutionConfig: a new config with the best choices selected, or the initial config
+        if all options are already specified.
     """
     updated_values = {}
     if config.gradient_method == "best":
@@ -313,6 +314,9 @@ def _update_config(config: ExecutionConfig) -> ExecutionConfig:
         }
     if config.grad_on_execution is None:
         updated_values["grad_on_execution"] = config.gradient_method == "adjoint"
+    if not updated_values:
+        # avoid re-running the validation in ``__post_init__`` when nothing changes
+        return config
     return replace(config, **updated_values)
 
 
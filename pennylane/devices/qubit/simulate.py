@@ -24,36 +24,30 @@ from .measure import measure
 from .sampling import measure_with_samples
 
 
-def simulate(circuit: qml.tape.QuantumScript, rng=None, debugger=None) -> Result:
-    """Simulate a single quantum script.
+def _map_wires_to_integers(circuit):
+    """Map the wires of a circuit onto consecutive integers if custom wire labels are used."""
+    if set(circuit.wires) != set(range(circuit.num_wires)):
+        wire_map = {w: i for i, w in enumerate(circuit.wires)}
+        circuit = qml.map_wires(circuit, wire_map)
+    return circuit
+
+
+def get_final_state(circuit, debugger=None):
+    """
+    Get the final state that results from executing the given quantum script.
 
     This is an internal function that will be called by the successor to ``default.qubit``.
 
     Args:
         circuit (.QuantumScript): The single circuit to simulate
-        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
-            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
-            If no value is provided, a default RNG will be used.
         debugger (._Debugger): The debugger to use
 
     Returns:
-        tuple(TensorLike): The results of the simulation
-
-    Note that this function can return measurements for non-commuting observables simultaneously.
-
-    It does currently not support sampling or observables without diagonalizing gates.
-
-    This function assumes that all operations provide matrices.
-
-    >>> qs = qml.tape.QuantumScript([qml.RX(1.2, wires=0)], [qml.expval(qml.PauliZ(0)), qml.probs(wires=(0,1))])
-    >>> simulate(qs)
-    (0.36235775447667357,
-    tensor([0.68117888, 0.        , 0.31882112, 0.        ], requires_grad=True))
+        Tuple[TensorLike, bool]: A tuple containing the final state of the quantum script and
+            whether the state has a batch dimension.
 
     """
-    if set(circuit.wires) != set(range(circuit.num_wires)):
-        wire_map = {w: i for i, w in enumerate(circuit.wires)}
-        circuit = qml.map_wires(circuit, wire_map)
+    circuit = _map_wires_to_integers(circuit)
 
     state = create_initial_state(circuit.wires, circuit._prep[0] if circuit._prep else None)
 
@@ -68,6 +62,28 @@ def simulate(circuit: qml.tape.QuantumScript, rng=None, debugger=None) -> Result
         # new state is batched if i) the old state is batched, or ii) the new op adds a batch dim
         is_state_batched = is_state_batched or op.batch_size is not None
 
+    return state, is_state_batched
+
+
+def measure_final_state(circuit, state, is_state_batched, rng=None) -> Result:
+    """
+    Perform the measurements required by the circuit on the provided state.
+
+    This is an internal function that will be called by the successor to ``default.qubit``.
+
+    Args:
+        circuit (.QuantumScript): The single circuit to simulate
+        state (TensorLike): The state to perform measurement on
+        is_state_batched (bool): Whether the state has a batch dimension or not.
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used.
+
+    Returns:
+        Tuple[TensorLike]: The measurement results
+    """
+    circuit = _map_wires_to_integers(circuit)
+
     if not circuit.shots:
         # analytic case
 
@@ -97,3 +113,35 @@ def simulate(circuit: qml.tape.QuantumScript, rng=None, debugger=None) -> Result
 
     # shot vector case: move the shot vector axis before the measurement axis
     return tuple(zip(*results))
+
+
+def simulate(circuit: qml.tape.QuantumScript, rng=None, debugger=None) -> Result:
+    """Simulate a single quantum script.
+
+    This is an internal function that will be called by the successor to ``default.qubit``.
+
+    Args:
+        circuit (.QuantumScript): The single circuit to simulate
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used.
+        debugger (._Debugger): The debugger to use
+
+    Returns:
+        tuple(TensorLike): The results of the simulation
+
+    Note that this function can return measurements for non-commuting observables simultaneously.
+
+    It does currently not support sampling or observables without diagonalizing gates.
+
+    This function assumes that all operations provide matrices.
+
+    >>> qs = qml.tape.QuantumScript([qml.RX(1.2, wires=0)], [qml.expval(qml.PauliZ(0)), qml.probs(wires=(0,1))])
+    >>> simulate(qs)
+    (0.36235775447667357,
+    tensor([0.68117888, 0.        , 0.31882112, 0.        ], requires_grad=True))
+
+    """
+    circuit = _map_wires_to_integers(circuit)
+    state, is_state_batched = get_final_state(circuit, debugger=debugger)
+    return measure_final_state(circuit, state, is_state_batched, rng=rng)
@@ -1126,23 +1126,20 @@ def _check_density_matrix(density_matrix):
         density_matrix = qml.math.stack([density_matrix])
 
     if not is_abstract(density_matrix):
-        for dm in density_matrix:
-            # Check trace
-            trace = np.trace(dm)
-            if not allclose(trace, 1.0, atol=1e-10):
-                raise ValueError("The trace of the density matrix should be one.")
-
-            # Check if the matrix is Hermitian
-            conj_trans = np.transpose(np.conj(dm))
-            if not allclose(dm, conj_trans):
-                raise ValueError("The matrix is not Hermitian.")
-
-            # Check if positive semi-definite
-            evs, _ = qml.math.linalg.eigh(dm)
-            evs = np.real(evs)
-            evs_non_negative = [ev for ev in evs if ev >= -1e-7]
-            if len(evs) != len(evs_non_negative):
-                raise ValueError("The matrix is not positive semi-definite.")
+        # Check traces of the whole batch at once
+        traces = einsum("aii->a", density_matrix)
+        if not allclose(traces, 1.0, atol=1e-10):
+            raise ValueError("The trace of the density matrix should be one.")
+
+        # Check if the matrices are Hermitian
+        conj_trans = np.conj(qml.math.transpose(density_matrix, (0, 2, 1)))
+        if not allclose(density_matrix, conj_trans):
+            raise ValueError("The matrix is not Hermitian.")
+
+        # Check if positive semi-definite; the eigenvectors are not needed
+        evs = np.real(qml.math.eigvalsh(density_matrix))
+        if qml.math.min(evs) < -1e-7:
+            raise ValueError("The matrix is not positive semi-definite.")
 
 
 def _check_state_vector(state_vector):
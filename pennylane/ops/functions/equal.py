@@ -15,8 +15,12 @@
 This module contains the qml.equal function.
 """
 # pylint: disable=too-many-arguments,too-many-return-statements
+import cmath
 from functools import singledispatch
 from typing import Union
+
+import numpy as np
+
 import pennylane as qml
 from pennylane.measurements import MeasurementProcess
 from pennylane.measurements.classical_shadow import ShadowExpvalMP
@@ -152,6 +156,62 @@ def equal(
     )
 
 
+_SCALAR_TYPES = (int, float, complex, np.number)
+
+
+def _tolerant_equals(d1, d2, rtol=1e-5, atol=1e-9):
+    """Check whether two parameters are equal within the given tolerance.
+
+    Python and NumPy scalars are compared directly, using the same criterion as
+    ``np.allclose``, to avoid the overhead of dispatching to ``qml.math.allclose``.
+    """
+    if isinstance(d1, _SCALAR_TYPES) and isinstance(d2, _SCALAR_TYPES):
+        # like ``np.allclose``, infinite values are only close to themselves
+        return d1 == d2 or (not cmath.isinf(d2) and abs(d1 - d2) <= atol + rtol * abs(d2))
+    return qml.math.allclose(d1, d2, rtol=rtol, atol=atol)
+
+
+def _hyperparameters_equal(hp1, hp2, **kwargs):
+    """Check whether two dictionaries of operator hyperparameters are equal.
+
+    Arrays are compared elementwise and operators are compared with :func:`~.equal`, since
+    comparing them with ``==`` is ambiguous or only checks for identity, respectively. Lists
+    and tuples are compared item by item following the same rules.
+    """
+    if hp1.keys() != hp2.keys():
+        return False
+
+    return all(
+        _hyperparameter_values_equal(value, hp2[key], **kwargs) for key, value in hp1.items()
+    )
+
+
+def _hyperparameter_values_equal(value1, value2, **kwargs):
+    """Check whether two values of the same operator hyperparameter are equal."""
+    if value1 is value2:
+        return True
+
+    if isinstance(value1, (Operator, MeasurementProcess)):
+        try:
+            return equal(value1, value2, **kwargs)
+        except NotImplementedError:
+            return False
+
+    if isinstance(value1, (list, tuple)):
+        return (
+            type(value1) is type(value2)
+            and len(value1) == len(value2)
+            and all(
+                _hyperparameter_values_equal(v1, v2, **kwargs) for v1, v2 in zip(value1, value2)
+            )
+        )
+
+    if isinstance(value1, np.ndarray) or isinstance(value2, np.ndarray):
+        return np.array_equal(value1, value2)
+
+    return value1 == value2
+
+
 @singledispatch
 def _equal(
     op1,
@@ -186,14 +246,30 @@ def _equal_operators(
         raise NotImplementedError(
             "Comparison of operators with an arithmetic depth larger than 0 is not yet implemented."
         )
+    if op1 is op2:
+        return True
+
+    # compare the cheap attributes first, so that the numeric comparison
+    # of the data is only performed if it can change the outcome
+    if op1.wires != op2.wires:
+        return False
+
+    if len(op1.data) != len(op2.data):
+        return False
+
     if not all(
-        qml.math.allclose(d1, d2, rtol=rtol, atol=atol) for d1, d2 in zip(op1.data, op2.data)
+        _tolerant_equals(d1, d2, rtol=rtol, atol=atol) for d1, d2 in zip(op1.data, op2.data)
     ):
         return False
-    if op1.wires != op2.wires:
-        return False
 
-    if op1.hyperparameters != op2.hyperparameters:
+    if not _hyperparameters_equal(
+        op1.hyperparameters,
+        op2.hyperparameters,
+        check_interface=check_interface,
+        check_trainability=check_trainability,
+        rtol=rtol,
+        atol=atol,
+    ):
         return False
 
     if check_trainability:
@@ -333,6 +409,9 @@ def _equal_measurements(
 ):
     """Determine whether two MeasurementProcess objects are equal"""
 
+    if op1 is op2:
+        return True
+
     if op1.obs is not None and op2.obs is not None:
         return equal(
             op1.obs,
@@ -349,10 +428,16 @@ def _equal_measurements(
     if op1.obs is None and op2.obs is None:
         # only compare eigvals if both observables are None.
         # Can be expensive to compute for large observables
-        if op1.eigvals() is not None and op2.eigvals() is not None:
-            return qml.math.allclose(op1.eigvals(), op2.eigvals(), rtol=rtol, atol=atol)
+        eigvals1, eigvals2 = op1.eigvals(), op2.eigvals()
+        if eigvals1 is eigvals2:
+            return True
+        if eigvals1 is not None and eigvals2 is not None:
+            # allclose broadcasts, so eigenvalues of different shapes must be rejected first
+            if qml.math.shape(eigvals1) != qml.math.shape(eigvals2):
+                return False
+            return qml.math.allclose(eigvals1, eigvals2, rtol=rtol, atol=atol)
 
-        return op1.eigvals() is None and op2.eigvals() is None
+        return eigvals1 is None and eigvals2 is None
 
     return False
 
@@ -380,6 +465,9 @@ def _(op1: MutualInfoMP, op2: MutualInfoMP, **kwargs):
 def _equal_shadow_measurements(op1: ShadowExpvalMP, op2: ShadowExpvalMP, **kwargs):
     """Determine whether two ShadowExpvalMP objects are equal"""
 
+    if op1 is op2:
+        return True
+
     wires_match = op1.wires == op2.wires
     H_match = op1.H == op2.H
     k_match = op1.k == op2.k
@@ -44,7 +44,9 @@ def __getattr__(name):
     automatically loaded with PennyLane"""
     if name in class_map:
         mod = importlib.import_module("." + class_map[name], __name__)
-        return getattr(mod, name)
+        # store the class on the module so that later lookups do not go through __getattr__
+        globals()[name] = getattr(mod, name)
+        return globals()[name]
     if name in mods:
         return importlib.import_module("." + name, __name__)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
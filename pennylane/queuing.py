@@ -532,7 +532,14 @@ def apply(op, context=QueuingManager):
     if not QueuingManager.recording():
         raise RuntimeError("No queuing context available to append operation to.")
 
-    if op in getattr(context, "queue", QueuingManager.active_context().queue):
+    target_context = context if hasattr(context, "queue") else QueuingManager.active_context()
+    if isinstance(target_context, AnnotatedQueue):
+        # annotated queues are keyed by object identity, avoiding a linear search of the queue
+        already_queued = WrappedObj(op) in target_context
+    else:
+        already_queued = op in target_context.queue
+
+    if already_queued:
         # Queuing contexts can only contain unique objects.
         # If the object to be queued already exists, copy it.
         op = copy.copy(op)
@@ -15,8 +15,9 @@ r"""
 Contains the BasisStatePreparation template.
 """
 
+import numpy as np
+
 import pennylane as qml
-import pennylane.numpy as np
 from pennylane.operation import Operation, AnyWires
 
 
@@ -78,7 +79,7 @@ class BasisStatePreparation(Operation):
                 )
 
             if not qml.math.is_abstract(state):
-                if any(bit not in [0, 1] for bit in state):
+                if not qml.math.all((state == 0) | (state == 1)):
                     raise ValueError(
                         f"Basis states must only consist of 0s and 1s; state {i} is {state}"
                     )
@@ -110,11 +111,14 @@ class BasisStatePreparation(Operation):
         PauliX(wires=['b'])]
         """
         if not qml.math.is_abstract(basis_state):
-            op_list = []
-            for wire, state in zip(wires, basis_state):
-                if state == 1:
-                    op_list.append(qml.PauliX(wire))
-            return op_list
+            if isinstance(basis_state, (np.ndarray, list, tuple)):
+                basis_state = np.asarray(basis_state)
+            else:
+                basis_state = qml.math.to_numpy(basis_state)
+
+            # locate the flipped bits in a single vectorized pass rather than comparing
+            # the bits one at a time, which is slow for tensors of the ML interfaces
+            return [qml.PauliX(wires[i]) for i in np.flatnonzero(basis_state == 1).tolist()]
 
         op_list = []
         for wire, state in zip(wires, basis_state):
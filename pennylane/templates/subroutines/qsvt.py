@@ -135,12 +135,11 @@ def qsvt(A, angles, wires, convention=None):
                     qml.Identity(wires=wires), 0.5j * np.pi * (4 - global_phase)
                 )
 
-    for idx, phi in enumerate(angles):
+    # iterate in reverse order to match equation
+    for idx in reversed(range(len(angles))):
         dim = c if idx % 2 else r
         with qml.QueuingManager.stop_recording():
-            projectors.append(PCPhase(phi, dim=dim, wires=wires))
-
-    projectors = projectors[::-1]  # reverse order to match equation
+            projectors.append(PCPhase(angles[idx], dim=dim, wires=wires))
 
     if convention == "Wx":
         return qml.prod(global_phase_op, QSVT(UA, projectors))
@@ -318,18 +317,17 @@ class QSVT(Operation):
         """
 
         op_list = []
-        UA_adj = copy.copy(UA)
+        # the adjoint block encoding is the same at every odd position, so it is built only once
+        with qml.QueuingManager.stop_recording():
+            UA_adj = adjoint(copy.copy(UA))
 
         for idx, op in enumerate(projectors[:-1]):
             qml.apply(op)
             op_list.append(op)
 
-            if idx % 2 == 0:
-                qml.apply(UA)
-                op_list.append(UA)
-
-            else:
-                op_list.append(adjoint(UA_adj))
+            U = UA if idx % 2 == 0 else UA_adj
+            qml.apply(U)
+            op_list.append(U)
 
         qml.apply(projectors[-1])
         op_list.append(projectors[-1])
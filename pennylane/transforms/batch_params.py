@@ -30,11 +30,8 @@ def _nested_stack(res):
     if not isinstance(res[0], (tuple, qml.numpy.builtins.SequenceBox)):
         return qml.math.stack(res)
 
-    stacked_results = []
-    for i in range(len(res[0])):
-        stacked_results.append(_nested_stack([r[i] for r in res]))
-
-    return tuple(stacked_results)
+    # transpose the batch and measurement axes in one pass instead of indexing every result
+    return tuple(_nested_stack(r) for r in zip(*res))
 
 
 @batch_transform
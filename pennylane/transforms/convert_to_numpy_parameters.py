@@ -22,8 +22,12 @@ from pennylane import math
 from pennylane.tape import QuantumScript
 
 
+def _needs_unwrapping(op: qml.operation.Operator) -> bool:
+    return bool(op.data) and math.get_interface(*op.data) != "numpy"
+
+
 def _convert_op_to_numpy_data(op: qml.operation.Operator) -> qml.operation.Operator:
-    if math.get_interface(*op.data) == "numpy":
+    if not _needs_unwrapping(op):
         return op
     # Use operator method to change parameters when it become available
     copied_op = copy.copy(op)
@@ -34,7 +38,7 @@ def _convert_op_to_numpy_data(op: qml.operation.Operator) -> qml.operation.Opera
 def _convert_measurement_to_numpy_data(
     m: qml.measurements.MeasurementProcess,
 ) -> qml.measurements.MeasurementProcess:
-    if m.obs is None or math.get_interface(*m.obs.data) == "numpy":
+    if m.obs is None or not _needs_unwrapping(m.obs):
         return m
     # Use measurement method to change parameters when it becomes available
     copied_m = copy.copy(m)
@@ -72,6 +76,7 @@ def convert_to_numpy_parameters(circuit: QuantumScript) -> QuantumScript:
             [0., 1.]], dtype=float32), wires=[0]))]
 
     If the component's data does not need to be transformed, it is left uncopied.
+    If none of the circuit's parameters need to be transformed, the circuit itself is returned.
 
     >>> circuit[0] is new_circuit[0]
     True
@@ -83,6 +88,9 @@ def convert_to_numpy_parameters(circuit: QuantumScript) -> QuantumScript:
     False
 
     """
+    components = circuit.operations + [m.obs for m in circuit.measurements if m.obs is not None]
+    if not any(_needs_unwrapping(op) for op in components):
+        return circuit
     new_prep = (_convert_op_to_numpy_data(op) for op in circuit._prep)
     new_ops = (_convert_op_to_numpy_data(op) for op in circuit._ops)
     new_measurements = (_convert_measurement_to_numpy_data(m) for m in circuit.measurements)
@@ -138,6 +138,8 @@ class TransformContainer:
     .. seealso:: :func:`~.pennylane.transforms.core.transform`
     """
 
+    __slots__ = ["_transform", "_args", "_kwargs", "_classical_cotransform", "_is_informative"]
+
     def __init__(
         self, transform, args=None, kwargs=None, classical_cotransform=None, is_informative=False
     ):  # pylint:disable=redefined-outer-name,too-many-arguments
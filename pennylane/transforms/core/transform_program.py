@@ -14,6 +14,8 @@
 """
 This module contains the transform program class.
 """
+from collections import deque
+
 from .transform_dispatcher import TransformContainer, TransformError
 
 
@@ -29,8 +31,10 @@ class TransformProgram:
 
     """
 
+    __slots__ = ["_transform_program"]
+
     def __init__(self):
-        self._transform_program = []
+        self._transform_program = deque()
 
     def __iter__(self):
         """list[TransformContainer]: Return an iterator to the underlying transform program."""
@@ -43,6 +47,8 @@ class TransformProgram:
     def __getitem__(self, idx):
         """(TransformContainer, List[TransformContainer]): Return the indexed transform container from underlying
         transform program"""
+        if isinstance(idx, slice):
+            return list(self._transform_program)[idx]
         return self._transform_program[idx]
 
     def __repr__(self):
@@ -76,7 +82,7 @@ class TransformProgram:
             raise TransformError(
                 "Informative transforms can only be added at the end of the program."
             )
-        self._transform_program.insert(0, transform_container)
+        self._transform_program.appendleft(transform_container)
 
     def pop_front(self):
         """Pop the transform container at the beginning of the program.
@@ -84,7 +90,7 @@ class TransformProgram:
         Returns:
             TransformContainer: The transform container at the beginning of the program.
         """
-        first_container = self._transform_program.pop(0)
+        first_container = self._transform_program.popleft()
         return first_container
 
     def get_last(self):
@@ -197,7 +197,6 @@ class op_transform:
             )
 
         self._fn = fn
-        self._sig = inspect.signature(fn).parameters
         self._tape_fn = None
         functools.update_wrapper(self, fn)
 
@@ -298,6 +297,12 @@ class op_transform:
             )
         return self._tape_fn(obj, *args, **kwargs)
 
+    @functools.cached_property
+    def _sig(self):
+        """mappingproxy: The parameters of the operator function signature, only inspected
+        when first needed."""
+        return inspect.signature(self._fn).parameters
+
     @property
     def is_qfunc_transform(self):
         """bool: Returns ``True`` if the operator transform is also a qfunc transform.
@@ -354,12 +354,14 @@ def test_hamiltonian_write_preserves_wire_map(tmp_path):
 def test_import_zstd_dill(monkeypatch):
     """Test if an ImportError is raised by _import_zstd_dill function."""
 
+    qml.data.dataset._import_zstd_dill.cache_clear()
     with monkeypatch.context() as m:
         m.setitem(sys.modules, "zstd", None)
 
         with pytest.raises(ImportError, match="This feature requires zstd and dill"):
             qml.data.dataset._import_zstd_dill()
 
+    qml.data.dataset._import_zstd_dill.cache_clear()
     with monkeypatch.context() as m:
         m.setitem(sys.modules, "dill", None)
 
@@ -14,11 +14,12 @@
 """
 Unit tests for the :class:`pennylane.data.Dataset` class and its functions.
 """
-# pylint:disable=protected-access
-from concurrent.futures import ThreadPoolExecutor
+# pylint:disable=protected-access,redefined-outer-name
 from unittest.mock import MagicMock, patch
 from glob import glob
+import json
 import os
+import threading
 
 import pytest
 import requests
@@ -54,15 +55,22 @@ def httpserver_listen_address():
     return ("localhost", 8888)
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk cache of the foldermap and data struct out of the user's cache."""
+    directory = str(tmp_path / "cache")
+    monkeypatch.setattr(qml.data.data_manager, "_cache_dir", directory)
+    return directory
+
+
 # pylint:disable=unused-argument
-def get_mock(url, timeout=1.0):
+def get_mock(url, headers=None, timeout=1.0):
     """Return the foldermap or data_struct according to URL"""
-    resp = MagicMock(ok=True)
-    resp.json.return_value = _folder_map if "foldermap" in url else _data_struct
-    return resp
+    content = _folder_map if "foldermap" in url else _data_struct
+    return MagicMock(ok=True, status_code=200, headers={}, content=json.dumps(content).encode())
 
 
-def submit_download_mock(_self, _fetch_and_save, filename, dest_folder):
+def fetch_and_save_mock(filename, dest_folder):
     """Patch to write a nonsense dataset rather than a downloaded one."""
     # If filename == foo/bar/x_y_z_attr.dat, content == "x_y_z_attr"
     content = os.path.splitext(os.path.basename(filename))[0]
@@ -71,15 +79,9 @@ def submit_download_mock(_self, _fetch_and_save, filename, dest_folder):
     qml.data.Dataset._write_file(content, os.path.join(dest_folder, filename))
 
 
-# pylint:disable=unused-argument
-def wait_mock_fixture(_futures, return_when=None):
-    """Patch to avoid raising exceptions after collecting threads."""
-    return MagicMock(done=[])
-
-
 @patch.object(qml.data.data_manager, "_foldermap", _folder_map)
 @patch.object(qml.data.data_manager, "_data_struct", _data_struct)
-@patch.object(requests, "get", get_mock)
+@patch.object(qml.data.data_manager._session, "get", get_mock)
 class TestValidateParams:
     """Test the _validate_params function."""
 
@@ -352,6 +354,8 @@ class TestLoadHelpers:
             actual_args_used = [i[0][1] for i in submit_mock.call_args_list]  # [args][second arg]
             assert sorted(expected_args_used) == sorted(actual_args_used)
             assert wait_mock.called_once_with([True, True])
+            assert os.path.isdir(os.path.join(dest, "qchem/H2/6-31G/0.50"))
+            assert os.path.isdir(os.path.join(dest, "qchem/H2/STO-3G/0.48"))
 
         def test_s3_download_force_false(self, _wait_mock, submit_mock, tmp_path):
             """Test _s3_download with force=False"""
@@ -377,6 +381,13 @@ class TestLoadHelpers:
             loaded_data.read(filename)
             assert loaded_data.molecule == "already_exists"
 
+        def test_s3_download_duplicate_folders(self, _wait_mock, submit_mock, tmp_path):
+            """Test that _s3_download only downloads a file once if its folder is repeated."""
+            qml.data.data_manager._s3_download(
+                "qchem", ["H2/6-31G/0.50", "H2/6-31G/0.50"], ["molecule"], str(tmp_path), True, 50
+            )
+            assert submit_mock.call_count == 1
+
         def test_s3_download_force_true(self, _wait_mock, submit_mock, tmp_path):
             """Test _s3_download with force=True"""
 
@@ -412,6 +423,21 @@ class TestLoadHelpers:
                     "qchem", ["H2/6-31G/0.50"], ["molecule"], str(tmp_path), False, 50
                 )
 
+        def test_s3_download_thread_failure_cancels_pending(
+            self, wait_mock, _submit_mock, tmp_path
+        ):
+            """Test that _s3_download cancels downloads that have not started after a failure."""
+            pending = MagicMock()
+            wait_mock.return_value = MagicMock(
+                done=[MagicMock(exception=MagicMock(return_value=ValueError("network error")))],
+                not_done=[pending],
+            )
+            with pytest.raises(ValueError, match="network error"):
+                qml.data.data_manager._s3_download(
+                    "qchem", ["H2/6-31G/0.50"], ["molecule"], str(tmp_path), False, 50
+                )
+            pending.cancel.assert_called_once()
+
     @pytest.mark.parametrize(
         ("filename", "called_with"),
         [
@@ -424,12 +450,13 @@ class TestLoadHelpers:
             ),
         ],
     )
-    @patch("requests.get")
+    @patch.object(qml.data.data_manager._session, "get")
     def test_fetch_and_save(self, get_and_write_mock, tmp_path, filename, called_with):
         """Test the _fetch_and_save helper function."""
         get_return = MagicMock()
+        get_return.__enter__.return_value = get_return
         get_return.raise_for_status.return_value = None
-        get_return.content = b"foobar"
+        get_return.iter_content.return_value = [b"foo", b"bar"]
         get_and_write_mock.return_value = get_return
 
         dest = str(tmp_path / "datasets")
@@ -437,14 +464,56 @@ class TestLoadHelpers:
         os.makedirs(os.path.dirname(destfile))
 
         qml.data.data_manager._fetch_and_save(filename, dest)
-        get_and_write_mock.assert_called_once_with(called_with, timeout=5.0)
+        get_and_write_mock.assert_called_once_with(called_with, timeout=5.0, stream=True)
         with open(destfile, "rb") as f:
             assert f.read() == b"foobar"
+        assert os.listdir(os.path.dirname(destfile)) == [os.path.basename(destfile)]
+
+    @patch.object(qml.data.data_manager._session, "get")
+    def test_fetch_and_save_interrupted(self, get_mock_, tmp_path):
+        """Test that an interrupted download does not leave a file behind."""
 
+        def iter_content(chunk_size):
+            yield b"foo"
+            raise requests.ConnectionError("connection lost")
 
-@patch.object(requests, "get", get_mock)
-@patch.object(ThreadPoolExecutor, "submit", submit_download_mock)
-@patch.object(qml.data.data_manager, "wait", wait_mock_fixture)
+        get_return = MagicMock()
+        get_return.__enter__.return_value = get_return
+        get_return.iter_content.side_effect = iter_content
+        get_mock_.return_value = get_return
+
+        dest = str(tmp_path)
+        with pytest.raises(requests.ConnectionError, match="connection lost"):
+            qml.data.data_manager._fetch_and_save("file.dat", dest)
+        assert not os.listdir(dest)
+
+    @patch.object(qml.data.data_manager._session, "get")
+    def test_fetch_and_save_concurrent(self, get_mock_, tmp_path):
+        """Test that overlapping downloads of the same file write to separate temporary files."""
+        dest = str(tmp_path)
+
+        def iter_content(chunk_size):
+            yield b"foo"
+            # a second download of the same file starts and completes during the first one
+            qml.data.data_manager._fetch_and_save("file.dat", dest)
+            yield b"bar"
+
+        outer, inner = MagicMock(), MagicMock()
+        outer.__enter__.return_value = outer
+        outer.iter_content.side_effect = iter_content
+        inner.__enter__.return_value = inner
+        inner.iter_content.return_value = [b"foobar"]
+        get_mock_.side_effect = [outer, inner]
+
+        qml.data.data_manager._fetch_and_save("file.dat", dest)
+
+        assert os.listdir(dest) == ["file.dat"]
+        with open(os.path.join(dest, "file.dat"), "rb") as f:
+            assert f.read() == b"foobar"
+
+
+@patch.object(qml.data.data_manager._session, "get", get_mock)
+@patch.object(qml.data.data_manager, "_fetch_and_save", fetch_and_save_mock)
 class TestLoad:
     """Test the load() method."""
 
@@ -537,6 +606,7 @@ class TestLoad:
         )[0]
         assert data._fullfile is None if fullfile is None else os.path.join(dest, fullfile)
 
+    @patch.object(qml.data.data_manager, "_foldermap", dict(_folder_map))
     @patch("pennylane.data.data_manager._generate_folders", side_effect=original_generate_folders)
     def test_full_overrides_nonfull(self, generate_mock, tmp_path):
         """When a list has 'full' plus other things, assert that only 'full' is downloaded."""
@@ -550,17 +620,11 @@ class TestLoad:
             folder_path=dest,
         )
         assert len(datasets) == 3
-        assert generate_mock.call_count == 3
-        arglist = generate_mock.call_args_list
-        assert arglist[0][0] == (  # [first call][args]
+        generate_mock.assert_called_once_with(
             {"H2": {"6-31G": ["0.46", "1.16", "1.0"]}},
             [["H2"], ["6-31G"], ["full"]],  # 0.46 was removed from the last list!
         )
 
-        # these test that _generate_folders carried on as expected
-        assert arglist[1][0] == ({"6-31G": ["0.46", "1.16", "1.0"]}, [["6-31G"], ["full"]])
-        assert arglist[2][0] == (["0.46", "1.16", "1.0"], [["full"]])
-
         # assert that the "molecule" attribute was dropped
         assert sorted(glob(os.path.join(dest, "**/*.dat"), recursive=True)) == [
             os.path.join(dest, "datasets/qchem/H2/6-31G/0.46/H2_6-31G_0.46_full.dat"),
@@ -568,6 +632,34 @@ class TestLoad:
             os.path.join(dest, "datasets/qchem/H2/6-31G/1.16/H2_6-31G_1.16_full.dat"),
         ]
 
+    @patch.object(qml.data.data_manager, "_foldermap", dict(_folder_map))
+    @patch("pennylane.data.data_manager._generate_folders", side_effect=original_generate_folders)
+    def test_resolved_folders_are_cached(self, generate_mock, tmp_path):
+        """Test that loading the same datasets twice only walks the foldermap once."""
+        for _ in range(2):
+            datasets = qml.data.load(
+                "qchem", molname="H2", basis="6-31G", bondlength="full", folder_path=str(tmp_path)
+            )
+            assert len(datasets) == 3
+        generate_mock.assert_called_once()
+
+    def test_resolved_folders_follow_foldermap(self):
+        """Test that folders are resolved again when the foldermap is replaced."""
+        folders = (("H2",), ("6-31G",), ("full",))
+        with patch.object(
+            qml.data.data_manager, "_foldermap", {"qchem": {"H2": {"6-31G": ["0.46"]}}}
+        ):
+            assert qml.data.data_manager._resolve_folders("qchem", folders) == (
+                os.path.join("H2", "6-31G", "0.46"),
+            )
+        with patch.object(
+            qml.data.data_manager, "_foldermap", {"qchem": {"H2": {"6-31G": ["1.0", "1.16"]}}}
+        ):
+            assert qml.data.data_manager._resolve_folders("qchem", folders) == (
+                os.path.join("H2", "6-31G", "1.0"),
+                os.path.join("H2", "6-31G", "1.16"),
+            )
+
     def test_docstr_is_added_to_loaded_dataset(self, tmp_path):
         """Test that a docstring describing all attributes on a Dataset is set."""
         dest = str(tmp_path)
@@ -582,8 +674,7 @@ class TestLoad:
         assert data.__doc__ == "Quantum chemistry dataset."
 
 
-@patch.object(requests, "get", get_mock)
-@patch("pennylane.data.data_manager.sleep")
+@patch.object(qml.data.data_manager._session, "get", get_mock)
 @patch("pennylane.data.data_manager.load", return_value=[qml.data.Dataset()])
 @patch("builtins.input")
 class TestLoadInteractive:
@@ -593,7 +684,7 @@ class TestLoadInteractive:
     """
 
     @pytest.mark.parametrize(
-        ("side_effect", "data_name", "kwargs", "sleep_call_count"),
+        ("side_effect", "data_name", "kwargs"),
         [
             (
                 ["1", "1", "2", "", "", ""],
@@ -606,7 +697,6 @@ class TestLoadInteractive:
                     "basis": "6-31G",
                     "bondlength": "0.46",
                 },
-                2,
             ),
             (
                 ["2", "1, 4", "Y", "/my/path", "y"],
@@ -620,20 +710,16 @@ class TestLoadInteractive:
                     "lattice": "chain",
                     "layout": "1x4",
                 },
-                4,
             ),
         ],
     )
-    def test_load_interactive_success(
-        self, mock_input, mock_load, mock_sleep, side_effect, data_name, kwargs, sleep_call_count
-    ):  # pylint:disable=too-many-arguments
+    def test_load_interactive_success(self, mock_input, mock_load, side_effect, data_name, kwargs):
         """Test that load_interactive succeeds."""
         mock_input.side_effect = side_effect
         assert isinstance(qml.data.load_interactive(), qml.data.Dataset)
         mock_load.assert_called_once_with(data_name, **kwargs)
-        assert mock_sleep.call_count == sleep_call_count
 
-    def test_load_interactive_without_confirm(self, mock_input, mock_load, _mock_sleep):
+    def test_load_interactive_without_confirm(self, mock_input, mock_load):
         """Test that load_interactive returns None if the user doesn't confirm."""
         mock_input.side_effect = ["1", "1", "2", "", "", "n"]
         assert qml.data.load_interactive() is None
@@ -647,10 +733,11 @@ class TestLoadInteractive:
             (["3"], "Must enter an integer between 1 and 2"),
             (["1", "1", "0"], "Must enter a list of integers between 1 and 5"),
             (["1", "1", "1 2"], "Must enter a list of integers between 1 and 5"),
+            (["1", "1", "1, 6"], "Must enter a list of integers between 1 and 5"),
         ],
     )
     def test_load_interactive_invalid_inputs(
-        self, mock_input, _mock_load, _mock_sleep, side_effect, error_message
+        self, mock_input, _mock_load, side_effect, error_message
     ):
         """Test that load_interactive raises errors as expected."""
         mock_input.side_effect = side_effect
@@ -658,7 +745,7 @@ class TestLoadInteractive:
             qml.data.load_interactive()
 
 
-@patch.object(requests, "get", get_mock)
+@patch.object(qml.data.data_manager._session, "get", get_mock)
 class TestMiscHelpers:
     """Test miscellaneous helper functions in data_manager."""
 
@@ -685,3 +772,112 @@ class TestMiscHelpers:
         assert qml.data.list_attributes("qchem") == _data_struct["qchem"]["attributes"]
         with pytest.raises(ValueError, match="Currently the hosted datasets are of types"):
             qml.data.list_attributes("invalid_data_name")
+
+    def test_missing_files(self, tmp_path):
+        """Test that _missing_files only returns files that do not exist locally."""
+        qml.data.Dataset(molecule="exists").write(str(tmp_path / "qchem/H2/a/H2_a_molecule.dat"))
+        files = [
+            os.path.join("qchem", "H2", "a", "H2_a_molecule.dat"),
+            os.path.join("qchem", "H2", "a", "H2_a_hamiltonian.dat"),
+            os.path.join("qchem", "H2", "b", "H2_b_molecule.dat"),
+        ]
+        assert qml.data.data_manager._missing_files(files, str(tmp_path)) == files[1:]
+
+    @patch("threading.Thread")
+    def test_preload_zstd_dill(self, thread_mock):
+        """Test that zstd and dill are only imported in the background if not imported yet."""
+        qml.data.dataset._import_zstd_dill.cache_clear()
+        qml.data.data_manager._preload_zstd_dill()
+        thread_mock.assert_called_once()
+        thread_mock.return_value.start.assert_called_once()
+
+        thread_mock.call_args[1]["target"]()
+        assert qml.data.dataset._import_zstd_dill.cache_info().currsize == 1
+
+        qml.data.data_manager._preload_zstd_dill()
+        thread_mock.assert_called_once()
+
+    def test_refresh_foldermap_fetches_once(self, monkeypatch):
+        """Test that concurrent refreshes of the foldermap only fetch it once."""
+        monkeypatch.setattr(qml.data.data_manager, "_foldermap", {})
+        fetched = threading.Event()
+        calls = []
+
+        def slow_get(url, headers=None, timeout=1.0):
+            calls.append(url)
+            fetched.wait(timeout=5)
+            return get_mock(url)
+
+        monkeypatch.setattr(qml.data.data_manager._session, "get", slow_get)
+        threads = [
+            threading.Thread(target=qml.data.data_manager._refresh_foldermap) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        fetched.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [qml.data.data_manager.FOLDERMAP_URL]
+        assert qml.data.data_manager._foldermap == _folder_map
+
+    def test_resize_session_pool(self, monkeypatch):
+        """Test that the shared session only remounts its adapter to grow the connection pool."""
+        session = requests.Session()
+        monkeypatch.setattr(qml.data.data_manager, "_session", session)
+        monkeypatch.setattr(qml.data.data_manager, "_session_pool_size", 0)
+
+        qml.data.data_manager._resize_session_pool(10)
+        adapter = session.get_adapter("https://")
+        assert adapter._pool_maxsize == 10
+        assert adapter.max_retries.total == 3
+
+        qml.data.data_manager._resize_session_pool(5)
+        assert session.get_adapter("https://") is adapter
+
+        qml.data.data_manager._resize_session_pool(20)
+        assert session.get_adapter("https://")._pool_maxsize == 20
+
+
+class TestFetchJson:
+    """Test that the foldermap and data struct are cached on disk between sessions."""
+
+    @staticmethod
+    def make_response(status_code, content=b"", etag=None):
+        """Create a mock response with the given status and content."""
+        resp = MagicMock(status_code=status_code, content=content)
+        resp.headers = {"ETag": etag} if etag else {}
+        return resp
+
+    def test_fetch_json_writes_cache(self, cache_dir):
+        """Test that a response with an ETag is cached along with its ETag."""
+        response = self.make_response(200, b'{"qchem": {}}', etag='"abc"')
+        with patch.object(qml.data.data_manager._session, "get", return_value=response) as get:
+            assert qml.data.data_manager._fetch_json("url", "foldermap.json") == {"qchem": {}}
+
+        get.assert_called_once_with("url", headers={}, timeout=5.0)
+        with open(os.path.join(cache_dir, "foldermap.json"), "rb") as f:
+            assert f.read() == b'{"qchem": {}}'
+        with open(os.path.join(cache_dir, "foldermap.json.etag"), "r", encoding="utf-8") as f:
+            assert f.read() == '"abc"'
+
+    def test_fetch_json_not_modified(self, cache_dir):
+        """Test that the cached file is used if the server reports it has not changed."""
+        os.makedirs(cache_dir)
+        with open(os.path.join(cache_dir, "foldermap.json"), "w", encoding="utf-8") as f:
+            f.write('{"qspin": {}}')
+        with open(os.path.join(cache_dir, "foldermap.json.etag"), "w", encoding="utf-8") as f:
+            f.write('"abc"')
+
+        response = self.make_response(304)
+        with patch.object(qml.data.data_manager._session, "get", return_value=response) as get:
+            assert qml.data.data_manager._fetch_json("url", "foldermap.json") == {"qspin": {}}
+
+        get.assert_called_once_with("url", headers={"If-None-Match": '"abc"'}, timeout=5.0)
+
+    def test_fetch_json_without_etag(self, cache_dir):
+        """Test that nothing is cached if the response has no ETag."""
+        response = self.make_response(200, b'{"qchem": {}}')
+        with patch.object(qml.data.data_manager._session, "get", return_value=response):
+            assert qml.data.data_manager._fetch_json("url", "foldermap.json") == {"qchem": {}}
+        assert not os.path.exists(cache_dir)
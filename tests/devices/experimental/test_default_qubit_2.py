@@ -14,6 +14,8 @@
 """Tests for default qubit 2."""
 # pylint: disable=import-outside-toplevel
 
+import sys
+
 import pytest
 
 import numpy as np
@@ -118,6 +120,24 @@ class TestTracking:
         }
         assert tracker.latest == {"batches": 1, "executions": 2}
 
+    def test_tracking_execute_and_derivatives(self):
+        """Test that the tracker records executions and derivatives computed together."""
+
+        qs = qml.tape.QuantumScript([], [qml.expval(qml.PauliZ(0))])
+
+        dev = DefaultQubit2()
+        config = ExecutionConfig(gradient_method="adjoint")
+        with qml.Tracker(dev) as tracker:
+            dev.execute_and_compute_derivatives([qs, qs], config)
+
+        assert tracker.totals == {
+            "batches": 1,
+            "executions": 2,
+            "derivative_batches": 1,
+            "derivatives": 2,
+        }
+        assert tracker.history["resources"] == [Resources(num_wires=1), Resources(num_wires=1)]
+
     def test_tracking_resources(self):
         """Test that resources are tracked for the experimental default qubit device."""
         qs = qml.tape.QuantumScript(
@@ -738,6 +758,83 @@ class TestExecutingBatches:
         assert qml.math.allclose(g1, g3)
 
 
+class TestParallelExecution:
+    """Tests executing a batch of circuits with the ``max_workers`` device option."""
+
+    config = ExecutionConfig(device_options={"max_workers": 2})
+
+    def test_matches_sequential_execution(self):
+        """Test that executing in parallel gives the same results in the same order."""
+        batch = [
+            qml.tape.QuantumScript([qml.RX(x, "a")], [qml.expval(qml.PauliZ("a"))])
+            for x in np.linspace(0, np.pi, 5)
+        ]
+        dev = DefaultQubit2()
+
+        results = dev.execute(batch, self.config)
+        assert isinstance(results, tuple)
+        assert qml.math.allclose(results, dev.execute(batch))
+        assert qml.math.allclose(results, np.cos(np.linspace(0, np.pi, 5)))
+
+    def test_seeded_parallel_execution(self):
+        """Test that parallel executions with finite shots are reproducible with a seed."""
+        qs = qml.tape.QuantumScript([qml.Hadamard(0)], [qml.sample(wires=0)], shots=100)
+
+        result1 = DefaultQubit2(seed=123).execute([qs, qs, qs], self.config)
+        result2 = DefaultQubit2(seed=123).execute([qs, qs, qs], self.config)
+
+        assert all(np.all(res1 == res2) for res1, res2 in zip(result1, result2))
+
+    def test_seeded_parallel_matches_sequential(self):
+        """Test that parallel executions with finite shots give the same samples as sequential
+        executions with the same seed."""
+        batch = [
+            qml.tape.QuantumScript([qml.RX(x, 0)], [qml.sample(wires=0)], shots=100)
+            for x in np.linspace(0, np.pi, 3)
+        ]
+
+        parallel = DefaultQubit2(seed=123).execute(batch, self.config)
+        sequential = DefaultQubit2(seed=123).execute(batch)
+
+        assert all(np.all(res1 == res2) for res1, res2 in zip(parallel, sequential))
+
+    def test_inside_queuing_context(self):
+        """Test that executing in parallel inside a queuing context neither blocks nor queues
+        anything into the active context."""
+        batch = [
+            qml.tape.QuantumScript([qml.RY(x, "a")], [qml.expval(qml.PauliX("a"))])
+            for x in np.linspace(0, np.pi, 5)
+        ]
+        dev = DefaultQubit2()
+
+        with qml.queuing.AnnotatedQueue() as q:
+            results = dev.execute(batch, self.config)
+
+        assert len(q.queue) == 0
+        assert qml.math.allclose(results, np.sin(np.linspace(0, np.pi, 5)))
+
+    @pytest.mark.parametrize("max_workers", [0, -2, 1.5, True, "4"])
+    def test_invalid_max_workers(self, max_workers):
+        """Test that an error is raised if max_workers is not a positive integer."""
+        qs = qml.tape.QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.PauliZ(0))])
+        config = ExecutionConfig(device_options={"max_workers": max_workers})
+
+        with pytest.raises(qml.DeviceError, match="max_workers must be a positive integer"):
+            DefaultQubit2().execute([qs, qs], config)
+
+    def test_debugger_executes_sequentially(self, mocker):
+        """Test that circuits are not executed in a thread pool while a debugger is active."""
+        spy = mocker.spy(sys.modules[DefaultQubit2.__module__], "ThreadPoolExecutor")
+        qs = qml.tape.QuantumScript([qml.Snapshot()], [qml.expval(qml.PauliZ(0))])
+        dev = DefaultQubit2()
+
+        with qml.debugging._Debugger(dev) as debugger:  # pylint: disable=protected-access
+            dev.execute([qs, qs], self.config)
+
+        spy.assert_not_called()
+        assert len(debugger.snapshots) == 2
+
+
 class TestSumOfTermsDifferentiability:
     """Basically a copy of the `qubit.simulate` test but using the device instead."""
 
@@ -885,6 +982,31 @@ class TestAdjointDifferentiation:
         assert isinstance(actual_grad[1], tuple)
         assert qml.math.allclose(actual_grad[1], expected_grad[1])
 
+    def test_execute_and_derivatives_single_forward_pass(self, mocker):
+        """Tests that executing and differentiating together only evolves the state once."""
+        adjoint_module = sys.modules["pennylane.devices.qubit.adjoint_jacobian"]
+        spy = mocker.spy(adjoint_module, "create_initial_state")
+        dev = DefaultQubit2()
+        x = np.array(np.pi / 7)
+        qs = qml.tape.QuantumScript(
+            [qml.RY(x, "a")], [qml.expval(qml.PauliX("a")), qml.expval(qml.PauliZ("a"))]
+        )
+
+        actual_val, actual_grad = dev.execute_and_compute_derivatives(qs, self.ec)
+        assert qml.math.allclose(actual_val, (qml.math.sin(x), qml.math.cos(x)))
+        assert qml.math.allclose(actual_grad, (qml.math.cos(x), -qml.math.sin(x)))
+        spy.assert_not_called()
+
+        assert qml.math.allclose(actual_grad, dev.compute_derivatives(qs, self.ec))
+        spy.assert_called_once()
+
+    def test_execute_and_derivatives_unsupported_method(self):
+        """Tests that an error is raised if the gradient method is not adjoint."""
+        dev = DefaultQubit2()
+        qs = qml.tape.QuantumScript([], [qml.expval(qml.PauliZ(0))])
+        with pytest.raises(NotImplementedError, match="cannot compute derivatives via backprop"):
+            dev.execute_and_compute_derivatives(qs, ExecutionConfig(gradient_method="backprop"))
+
     def test_integration(self):
         """Tests the expected workflow done by a calling method."""
         dev = DefaultQubit2()
@@ -49,10 +49,18 @@ class TestMinimalDevice:
         """Test the default name is the name of the class"""
         assert self.dev.name == "MinimalDevice"
 
+    def test_device_name_cached(self):
+        """Test that the default name is computed once and stored on the instance."""
+        dev = self.MinimalDevice()
+        assert "name" not in vars(dev)
+        assert dev.name == "MinimalDevice"
+        assert vars(dev)["name"] == "MinimalDevice"
+
     def test_tracker_set_on_initialization(self):
         """Test that a new tracker instance is initialized with the class."""
         assert isinstance(self.dev.tracker, qml.Tracker)
-        assert self.dev.tracker is not self.MinimalDevice.tracker
+        assert self.dev.tracker is not self.MinimalDevice().tracker
+        assert not hasattr(self.MinimalDevice, "tracker")
 
     def test_preprocess_single_circuit(self):
         """Test that preprocessing wraps a circuit into a batch."""
@@ -68,6 +76,12 @@ class TestMinimalDevice:
         assert fn(a) is a
         assert config is qml.devices.experimental.DefaultExecutionConfig
 
+    def test_preprocess_reuses_postprocessing(self):
+        """Test that preprocessing returns the same identity postprocessing function every time."""
+        _, fn1, _ = self.dev.preprocess(qml.tape.QuantumScript())
+        _, fn2, _ = self.dev.preprocess((qml.tape.QuantumScript(),))
+        assert fn1 is fn2
+
     def test_preprocess_batch_circuits(self):
         """Test that preprocessing a batch doesn't do anything."""
 
@@ -80,6 +94,15 @@ class TestMinimalDevice:
         a = (1, 2)
         assert fn(a) is a
 
+    def test_preprocess_converts_batch_to_tuple(self):
+        """Test that preprocessing converts other sequences of circuits into a tuple."""
+
+        circuits = [qml.tape.QuantumScript(), qml.tape.QuantumScript()]
+        batch, _, _ = self.dev.preprocess(c for c in circuits)
+        assert isinstance(batch, tuple)
+        assert len(batch) == 2
+        assert all(b is c for b, c in zip(batch, circuits))
+
     def test_supports_derivatives_default(self):
         """Test that the default behavior of supports derivatives is false."""
 
@@ -194,3 +217,25 @@ class TestProvidingDerivatives:
         out = dev.execute_and_compute_vjp(qml.tape.QuantumScript(), (1.0,))
         assert out[0] == "a"
         assert out[1] == ("c",)
+
+    def test_overrides_inherited_by_subclasses(self):
+        """Test that a subclass of a device providing derivatives also supports them."""
+
+        class WithDerivative(Device):
+            """A device with a derivative."""
+
+            def execute(self, circuits, execution_config: ExecutionConfig = DefaultExecutionConfig):
+                return "a"
+
+            def compute_derivatives(
+                self, circuits, execution_config: ExecutionConfig = DefaultExecutionConfig
+            ):
+                return ("b",)
+
+        class Child(WithDerivative):
+            """A subclass of a device with a derivative."""
+
+        dev = Child()
+        assert dev.supports_derivatives()
+        assert not dev.supports_jvp()
+        assert not dev.supports_vjp()
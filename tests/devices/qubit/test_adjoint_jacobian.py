@@ -39,6 +39,18 @@ class TestAdjointJacobian:
         numeric_val = fn(results)
         assert np.allclose(calculated_val, numeric_val, atol=tol, rtol=0)
 
+    def test_provided_state(self, tol):
+        """Test that adjoint_jacobian uses a precomputed final state instead of re-executing."""
+        qs = QuantumScript(
+            [qml.RX(0.123, wires="a"), qml.RY(0.456, wires="b")], [qml.expval(qml.PauliX("a"))]
+        )
+        qs.trainable_params = {0, 1}
+        qs_valid = validate_and_expand_adjoint(qs)
+
+        state, _ = qml.devices.qubit.get_final_state(qs_valid)
+        calculated_val = adjoint_jacobian(qs_valid, state=state)
+        assert np.allclose(calculated_val, adjoint_jacobian(qs_valid), atol=tol, rtol=0)
+
     @pytest.mark.autograd
     @pytest.mark.parametrize("theta", np.linspace(-2 * np.pi, 2 * np.pi, 7))
     @pytest.mark.parametrize("G", [qml.RX, qml.RY, qml.RZ])
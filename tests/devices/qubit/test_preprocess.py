@@ -526,6 +526,15 @@ class TestPreprocess:
         assert new_config.use_device_gradient
         assert new_config.grad_on_execution
 
+    def test_fully_specified_config_is_reused(self):
+        """Test that preprocessing returns the same config if no options need to be chosen."""
+        tape = QuantumScript(ops=[], measurements=[])
+        config = qml.devices.ExecutionConfig(
+            gradient_method="adjoint", use_device_gradient=True, grad_on_execution=True
+        )
+        _, _, new_config = preprocess([tape], config)
+        assert new_config is config
+
     def test_preprocess_batch_transform_not_adjoint(self):
         """Test that preprocess returns the correct tapes when a batch transform
         is needed."""
@@ -18,7 +18,7 @@ import pytest
 import numpy as np
 
 import pennylane as qml
-from pennylane.devices.qubit import simulate
+from pennylane.devices.qubit import simulate, get_final_state, measure_final_state
 
 
 class TestCurrentlyUnsupportedCases:
@@ -63,6 +63,38 @@ class TestStatePrep:
         assert qml.math.allclose(probs, expected)
 
 
+class TestFinalStateAndMeasurement:
+    """Tests splitting a simulation into state evolution and measurement."""
+
+    def test_matches_simulate(self):
+        """Test that measuring the final state gives the same results as ``simulate``."""
+        qs = qml.tape.QuantumScript(
+            [qml.RX(0.5, "a"), qml.CNOT(("a", "b"))],
+            [qml.expval(qml.PauliZ("b")), qml.probs(wires="a")],
+        )
+        state, is_state_batched = get_final_state(qs)
+        assert not is_state_batched
+        assert qml.math.shape(state) == (2, 2)
+
+        results = measure_final_state(qs, state, is_state_batched)
+        expected = simulate(qs)
+        assert qml.math.allclose(results[0], expected[0])
+        assert qml.math.allclose(results[1], expected[1])
+
+    def test_batched_state(self):
+        """Test that a batch dimension added by an operation is reported."""
+        qs = qml.tape.QuantumScript(
+            [qml.RX([0.1, 0.2], 0)], [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(0))]
+        )
+        state, is_state_batched = get_final_state(qs)
+        assert is_state_batched
+        assert qml.math.shape(state) == (2, 2)
+
+        results = measure_final_state(qs, state, is_state_batched)
+        assert qml.math.allclose(results[0], np.cos([0.1, 0.2]))
+        assert qml.math.allclose(results[1], -np.sin([0.1, 0.2]))
+
+
 class TestBasicCircuit:
     """Tests a basic circuit with one rx gate and two simple expectation values."""
 
@@ -27,6 +27,8 @@ torch = pytest.importorskip("torch")
 jax = pytest.importorskip("jax")
 jnp = pytest.importorskip("jax.numpy")
 
+INV_SQRT2 = 1 / onp.sqrt(2)
+
 
 class TestFidelityMath:
     """Tests for Fidelity function between two states (state vectors or density matrix)."""
@@ -35,7 +37,7 @@ class TestFidelityMath:
         # Vector-Vector-Fid
         ([1, 0], [0, 1], 0),
         ([0, 1], [0, 1], 1.0),
-        ([1, 0], [1, 1] / np.sqrt(2), 0.5),
+        ([1, 0], [INV_SQRT2, INV_SQRT2], 0.5),
         # Vector-Density mat-Fid
         ([1, 0], [[0, 0], [0, 1]], 0),
         ([1, 0], [[1, 0], [0, 0]], 1.0),
@@ -56,13 +58,13 @@ class TestFidelityMath:
     ]
 
     array_funcs = [
-        lambda x: x,
-        onp.array,
-        np.array,
-        jnp.array,
-        torch.tensor,
-        tf.Variable,
-        tf.constant,
+        pytest.param(lambda x: x, id="list"),
+        pytest.param(onp.array, id="numpy"),
+        pytest.param(np.array, id="autograd"),
+        pytest.param(jnp.array, id="jax"),
+        pytest.param(torch.tensor, id="torch"),
+        pytest.param(tf.Variable, id="tf-variable"),
+        pytest.param(tf.constant, id="tf-constant"),
     ]
 
     check_state = [True, False]
@@ -152,12 +154,45 @@ class TestFidelityMath:
             with pytest.warns(UserWarning, match="passing state vectors to fidelity is deprecated"):
                 qml.math.fidelity(state0, state1, check_state=True)
 
+    batched_d_mat_invalid = [
+        ([[1, 0], [0, 1]], "The trace of the density matrix should be one"),
+        ([[0.5, 0.5], [0, 0.5]], "The matrix is not Hermitian"),
+        ([[1.5, 0], [0, -0.5]], "The matrix is not positive semi"),
+    ]
+
+    @pytest.mark.parametrize("invalid, msg", batched_d_mat_invalid)
+    @pytest.mark.parametrize("func", array_funcs)
+    def test_batched_density_matrix_invalid(self, invalid, msg, func):
+        """Test that a batch of density matrices is rejected if a single matrix in it is invalid,
+        with the same message as for an unbatched matrix."""
+        state0 = func([[[1, 0], [0, 0]], invalid, [[0.5, 0], [0, 0.5]]])
+        state1 = func([[0.5, 0], [0, 0.5]])
+        with pytest.raises(ValueError, match=msg):
+            qml.math.fidelity(state0, state1, check_state=True)
+        with pytest.raises(ValueError, match=msg):
+            qml.math.fidelity(state1, state0, check_state=True)
+
+    @pytest.mark.parametrize("func", array_funcs)
+    def test_batched_density_matrix_negative_eigenvalue_tolerance(self, func):
+        """Test that eigenvalues slightly below zero are accepted up to a tolerance of 1e-7."""
+        eps = 5e-8
+        state0 = func([[1, 0], [0, 0]])
+        state1 = func([[[1, 0], [0, 0]], [[1 + eps, 0], [0, -eps]]])
+
+        fidelity = qml.math.fidelity(state0, state1, check_state=True)
+        assert qml.math.allclose(fidelity, [1, 1])
+
+        eps = 5e-7
+        state1 = func([[[1, 0], [0, 0]], [[1 + eps, 0], [0, -eps]]])
+        with pytest.raises(ValueError, match="The matrix is not positive semi"):
+            qml.math.fidelity(state0, state1, check_state=True)
+
     @pytest.mark.parametrize("check_state", check_state)
     @pytest.mark.parametrize("func", array_funcs)
     def test_broadcast_sv_sv(self, check_state, func):
         """Test broadcasting works for fidelity and state vectors"""
         state0 = func([[1, 0], [0, 1], [1, 0]])
-        state1 = func([[0, 1], [0, 1], [1, 1] / np.sqrt(2)])
+        state1 = func([[0, 1], [0, 1], [INV_SQRT2, INV_SQRT2]])
         expected = [0, 1, 0.5]
 
         with pytest.warns(
@@ -172,7 +207,7 @@ class TestFidelityMath:
     def test_broadcast_sv_sv_unbatched(self, check_state, func):
         """Test broadcasting works for fidelity and state vectors when one input is unbatched"""
         state0 = func([1, 0])
-        state1 = func([[0, 1], [1, 0], [1, 1] / np.sqrt(2)])
+        state1 = func([[0, 1], [1, 0], [INV_SQRT2, INV_SQRT2]])
         expected = [0, 1, 0.5]
 
         with pytest.warns(
@@ -257,7 +292,7 @@ class TestFidelityMath:
         """Test broadcasting works for fidelity and state vector/density matrix combinations
         when one input is unbatched"""
         state0 = func([[0.5, 0.5], [0.5, 0.5]])
-        state1 = func([[1, 0], [0, 1], [1, 1] / np.sqrt(2)])
+        state1 = func([[1, 0], [0, 1], [INV_SQRT2, INV_SQRT2]])
         expected = [0.5, 0.5, 1]
 
         with pytest.warns(
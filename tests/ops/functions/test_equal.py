@@ -16,6 +16,7 @@ Unit tests for the equal function.
 Tests are divided by number of parameters and wires different operators take.
 """
 import itertools
+import sys
 
 import numpy as np
 import pytest
@@ -1123,6 +1124,141 @@ class TestEqual:
         ):
             qml.equal(op1, op2)
 
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.RX(0.3, wires=0),
+            qml.prod(qml.PauliX(0), qml.RY(0.1, 1)),
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1)),
+            qml.probs(wires=[0, 1]),
+        ],
+    )
+    def test_identical_object_skips_comparison(self, op, mocker):
+        """Test that an operator or measurement is equal to itself without comparing its data."""
+        spy = mocker.spy(sys.modules["pennylane.ops.functions.equal"], "_tolerant_equals")
+        spy_eigvals = mocker.spy(qml.measurements.MeasurementProcess, "eigvals")
+        assert qml.equal(op, op)
+        spy.assert_not_called()
+        spy_eigvals.assert_not_called()
+
+    def test_identical_shadow_expval_skips_comparison(self, mocker):
+        """Test that a shadow expectation value equals itself without comparing its Hamiltonian."""
+        H = qml.Hamiltonian(
+            [1.0, 1.0], [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliX(0) @ qml.PauliX(1)]
+        )
+        m = qml.shadow_expval(H, k=2)
+        spy = mocker.spy(qml.Hamiltonian, "compare")
+        assert qml.equal(m, m)
+        spy.assert_not_called()
+
+    def test_different_wires_skip_data_comparison(self, mocker):
+        """Test that operators on different wires are not equal without comparing their data."""
+        spy = mocker.spy(qml.math, "allclose")
+        assert not qml.equal(qml.RX(0.3, wires=0), qml.RX(0.3, wires=1))
+        spy.assert_not_called()
+
+    def test_equal_with_different_number_of_parameters(self):
+        """Test that operators of the same type with a different number of parameters are not equal."""
+        op1 = qml.QubitUnitary(np.eye(2), wires=0)
+        op2 = qml.QubitUnitary(np.eye(2), wires=0)
+        op2.data = op2.data + (0.1,)
+        assert not qml.equal(op1, op2)
+
+    @pytest.mark.parametrize(
+        "x, y, res",
+        [
+            (0.3, 0.3 + 1e-10, True),
+            (0.3, 0.3 + 1e-3, False),
+            (np.float32(0.3), 0.3, True),
+            (1, np.int64(1), True),
+            (1e6, 1e6 + 1, True),
+            (np.inf, np.inf, True),
+            (np.inf, -np.inf, False),
+            (0.0, np.inf, False),
+            (np.nan, np.nan, False),
+            (0.5j, 0.5j + 1e-3, False),
+        ],
+    )
+    def test_scalar_parameters_match_allclose(self, x, y, res, mocker):
+        """Test that scalar parameters are compared like ``np.allclose`` without dispatching to it."""
+        spy = mocker.spy(qml.math, "allclose")
+        assert qml.equal(qml.PhaseShift(x, wires=0), qml.PhaseShift(y, wires=0)) == res
+        assert np.allclose(x, y, rtol=1e-5, atol=1e-9) == res
+        spy.assert_not_called()
+
+    def test_operator_hyperparameters_compared_with_equal(self):
+        """Test that operators stored as hyperparameters are compared by value."""
+        H1 = qml.Hamiltonian([1.0, 0.5], [qml.PauliZ(0), qml.PauliX(1)])
+        H2 = qml.Hamiltonian([1.0, 0.5], [qml.PauliZ(0), qml.PauliX(1)])
+        H3 = qml.Hamiltonian([1.0, 0.5], [qml.PauliZ(0), qml.PauliY(1)])
+
+        assert qml.equal(qml.ApproxTimeEvolution(H1, 0.1, 2), qml.ApproxTimeEvolution(H2, 0.1, 2))
+        assert not qml.equal(
+            qml.ApproxTimeEvolution(H1, 0.1, 2), qml.ApproxTimeEvolution(H3, 0.1, 2)
+        )
+
+        U = np.array([[0, 1], [1, 0]])
+        op1 = qml.QuantumPhaseEstimation(U, target_wires=[0], estimation_wires=[1])
+        op2 = qml.QuantumPhaseEstimation(U.copy(), target_wires=[0], estimation_wires=[1])
+        op3 = qml.QuantumPhaseEstimation(np.eye(2), target_wires=[0], estimation_wires=[1])
+        assert qml.equal(op1, op2)
+        assert not qml.equal(op1, op3)
+
+    def test_array_hyperparameters(self):
+        """Test that array-valued hyperparameters are compared elementwise."""
+
+        # pylint: disable=too-few-public-methods
+        class ArrayHyperparameterOp(qml.operation.Operation):
+            """Dummy operation with an array hyperparameter."""
+
+            num_wires = 1
+
+            def __init__(self, pattern, wires):
+                self._hyperparameters = {"pattern": pattern}
+                super().__init__(wires=wires)
+
+        op1 = ArrayHyperparameterOp(np.array([0, 1, 1]), wires=0)
+        op2 = ArrayHyperparameterOp(np.array([0, 1, 1]), wires=0)
+        op3 = ArrayHyperparameterOp(np.array([1, 1, 1]), wires=0)
+        op4 = ArrayHyperparameterOp(np.array([0, 1]), wires=0)
+
+        assert qml.equal(op1, op2)
+        assert not qml.equal(op1, op3)
+        assert not qml.equal(op1, op4)
+
+    def test_operator_list_hyperparameters(self):
+        """Test that lists and tuples of operators stored as hyperparameters are compared
+        item by item."""
+
+        # pylint: disable=too-few-public-methods
+        class OpListHyperparameterOp(qml.operation.Operation):
+            """Dummy operation with a hyperparameter holding operators."""
+
+            num_wires = 1
+
+            def __init__(self, ops, wires):
+                self._hyperparameters = {"ops": ops}
+                super().__init__(wires=wires)
+
+        op1 = OpListHyperparameterOp([qml.RX(0.1, 0), qml.PauliZ(0)], wires=0)
+        op2 = OpListHyperparameterOp([qml.RX(0.1, 0), qml.PauliZ(0)], wires=0)
+        op3 = OpListHyperparameterOp([qml.RX(0.2, 0), qml.PauliZ(0)], wires=0)
+        op4 = OpListHyperparameterOp([qml.RX(0.1, 0)], wires=0)
+        op5 = OpListHyperparameterOp((qml.RX(0.1, 0), qml.PauliZ(0)), wires=0)
+        op6 = OpListHyperparameterOp((qml.RX(0.1, 0), qml.PauliZ(0)), wires=0)
+
+        assert qml.equal(op1, op2)
+        assert not qml.equal(op1, op3)
+        assert not qml.equal(op1, op4)
+        assert not qml.equal(op1, op5)
+        assert qml.equal(op5, op6)
+
+        projectors1 = [qml.PCPhase(phi, dim=1, wires=0) for phi in (0.1, 0.2, 0.3)]
+        projectors2 = [qml.PCPhase(phi, dim=1, wires=0) for phi in (0.1, 0.2, 0.3)]
+        assert qml.equal(
+            qml.QSVT(qml.PauliX(wires=0), projectors1), qml.QSVT(qml.PauliX(wires=0), projectors2)
+        )
+
     # Measurements test cases
     @pytest.mark.parametrize("ops", PARAMETRIZED_MEASUREMENTS_COMBINATIONS)
     def test_not_equal_diff_measurement(self, ops):
@@ -1205,6 +1341,24 @@ class TestMeasurementsEqual:
         assert not qml.equal(m1, m2)
         assert qml.equal(m1, m2, rtol=1e-2)
 
+    def test_eigvals_computed_once(self, mocker):
+        """Test that the eigenvalues of each measurement are only computed once."""
+        m1 = ProbabilityMP(eigvals=(1, 0))
+        m2 = ProbabilityMP(eigvals=(1, 0))
+        spy = mocker.spy(ProbabilityMP, "eigvals")
+
+        assert qml.equal(m1, m2)
+        assert spy.call_count == 2
+
+    def test_eigvals_different_shapes(self):
+        """Test that measurements whose eigenvalues differ in shape are not equal, even if
+        the eigenvalues would broadcast against each other."""
+        m1 = ProbabilityMP(wires=qml.wires.Wires(0), eigvals=[1.0])
+        m2 = ProbabilityMP(wires=qml.wires.Wires(0), eigvals=[1.0, 1.0])
+
+        assert not qml.equal(m1, m2)
+        assert not qml.equal(m2, m1)
+
     def test_observables_equal_but_wire_order_not(self):
         """Test that when the wire orderings are not equal but the observables are, that
         we still get True."""
@@ -17,6 +17,7 @@ Unit tests for the BasisStatePreparation template.
 import pytest
 import numpy as np
 import pennylane as qml
+from pennylane import numpy as pnp
 
 
 class TestDecomposition:
@@ -47,6 +48,18 @@ class TestDecomposition:
             assert gate.name == "PauliX"
             assert gate.wires.tolist() == [target_wires[id]]
 
+    @pytest.mark.parametrize(
+        "basis_state", [[1, 0, 1, 1], (1, 0, 1, 1), np.array([1, 0, 1, 1]), pnp.array([1, 0, 1, 1])]
+    )
+    @pytest.mark.parametrize("wires", [["a", 2, "c", 0], qml.wires.Wires(["a", 2, "c", 0])])
+    def test_compute_decomposition(self, basis_state, wires):
+        """Tests that only the flipped bits are decomposed into PauliX gates."""
+        decomp = qml.BasisStatePreparation.compute_decomposition(basis_state, wires)
+
+        assert len(decomp) == 3
+        assert all(gate.name == "PauliX" for gate in decomp)
+        assert [gate.wires.tolist() for gate in decomp] == [["a"], ["c"], [0]]
+
     # fmt: off
     @pytest.mark.parametrize("basis_state,wires,target_state", [
         ([0], [0], [0, 0, 0]),
@@ -185,6 +198,13 @@ class TestInputs:
         with pytest.raises(ValueError, match="Basis states must only (contain|consist)"):
             qml.BasisStatePreparation(basis_state, wires)
 
+    def test_error_batched_basis_state_format(self):
+        """Tests that the error message names the invalid state of a batch."""
+        basis_state = np.array([[0, 1], [1, 0.5]])
+
+        with pytest.raises(ValueError, match="consist of 0s and 1s; state 1 is"):
+            qml.BasisStatePreparation(basis_state, wires=[0, 1])
+
     def test_exception_wrong_dim(self):
         """Verifies that exception is raised if the
         number of dimensions of features is incorrect."""
@@ -132,6 +132,39 @@ class TestQSVT:
             assert val.name == results[idx].name
             assert val.parameters == results[idx].parameters
 
+    def test_decomposition_reuses_adjoint(self):
+        """Test that the decomposition reuses a single adjoint block encoding."""
+        projectors = [qml.PCPhase(phi, dim=1, wires=0) for phi in (0.1, 0.2, 0.3, 0.4, 0.5)]
+        op = qml.QSVT(qml.PauliX(wires=0), projectors)
+
+        with qml.queuing.AnnotatedQueue():
+            decomp = op.compute_decomposition(**op.hyperparameters)
+        assert [o.name for o in decomp] == [
+            "PCPhase",
+            "PauliX",
+            "PCPhase",
+            "Adjoint(PauliX)",
+            "PCPhase",
+            "PauliX",
+            "PCPhase",
+            "Adjoint(PauliX)",
+            "PCPhase",
+        ]
+        assert decomp[3] is decomp[7]
+        assert decomp[3].base is not decomp[1]
+
+    def test_queuing_repeated_adjoint(self):
+        """Test that each repetition of the adjoint block encoding is queued."""
+        projectors = [qml.PCPhase(phi, dim=1, wires=0) for phi in (0.1, 0.2, 0.3, 0.4, 0.5)]
+
+        with qml.tape.QuantumTape() as tape:
+            qml.QSVT(qml.PauliX(wires=0), projectors)
+
+        ops = tape.expand().operations
+        assert len(ops) == 9
+        assert ops[3].name == ops[7].name == "Adjoint(PauliX)"
+        assert ops[3] is not ops[7]
+
     def test_queuing_ops_defined_in_circuit(self):
         """Test that qml.QSVT queues operations correctly when they are called in the qnode."""
         lst_projectors = [qml.PCPhase(0.2, dim=1, wires=0), qml.PCPhase(0.3, dim=1, wires=0)]
@@ -442,6 +442,33 @@ class TestApplyOp:
         assert tape1.operations == []
         assert tape2.operations == []
 
+    def test_apply_to_custom_recording_context(self):
+        """Test that objects already in a recording context that is not an annotated queue are
+        copied when applied again"""
+
+        class ListQueue:
+            """A minimal recording context storing the queue in a list"""
+
+            def __init__(self):
+                self.queue = []
+
+            def append(self, obj, **_):
+                self.queue.append(obj)
+
+            def remove(self, obj):
+                self.queue.remove(obj)
+
+        q = ListQueue()
+        qml.QueuingManager.add_active_queue(q)
+        try:
+            op1 = qml.PauliZ(0)
+            op2 = qml.apply(op1)
+        finally:
+            qml.QueuingManager.remove_active_queue()
+
+        assert op2 is not op1
+        assert q.queue == [op1, op2]
+
 
 class TestWrappedObj:
     """Tests for the ``WrappedObj`` class"""
@@ -32,15 +32,22 @@ ml_frameworks_list = [
 ]
 
 
-@pytest.mark.parametrize("framework", ml_frameworks_list)
-@pytest.mark.parametrize("shots", [None, 100])
-def test_convert_arrays_to_numpy(framework, shots):
-    """Tests that convert_to_numpy_parameters works with autograd arrays."""
+@pytest.fixture(scope="module", params=ml_frameworks_list)
+def ml_inputs(request):
+    """Circuit parameters of the machine learning framework under test, built once per module."""
+    framework = request.param
+    return {
+        "x": qml.math.asarray(np.array(1.234), like=framework),
+        "y": qml.math.asarray(np.array(0.652), like=framework),
+        "M": qml.math.asarray(np.eye(2), like=framework),
+        "state": qml.math.asarray(np.array([1, 0]), like=framework),
+    }
+
 
-    x = qml.math.asarray(np.array(1.234), like=framework)
-    y = qml.math.asarray(np.array(0.652), like=framework)
-    M = qml.math.asarray(np.eye(2), like=framework)
-    state = qml.math.asarray(np.array([1, 0]), like=framework)
+@pytest.mark.parametrize("shots", [None, 100])
+def test_convert_arrays_to_numpy(ml_inputs, shots):
+    """Tests that convert_to_numpy_parameters works with arrays of every ML framework."""
+    x, y, M, state = ml_inputs["x"], ml_inputs["y"], ml_inputs["M"], ml_inputs["state"]
 
     numpy_data = np.array(0.62)
 
@@ -64,6 +71,72 @@ def test_convert_arrays_to_numpy(framework, shots):
     assert new_qs.shots == qs.shots
 
 
+def test_numpy_circuit_is_returned_unchanged(recwarn):
+    """Test that a circuit whose parameters are all numpy is returned without being copied."""
+    ops = [qml.RX(0.5, 0), qml.RY(np.array(1.2), 1), qml.CNOT((0, 1))]
+    m = [qml.expval(qml.Hermitian(np.eye(2), 0)), qml.probs(wires=1)]
+    prep = [qml.QubitStateVector(np.array([1, 0]), 0)]
+    qs = qml.tape.QuantumScript(ops, m, prep, shots=10)
+
+    assert convert_to_numpy_parameters(qs) is qs
+    assert len(recwarn) == 0
+
+
+@pytest.mark.torch
+def test_mixed_interface_circuit(recwarn):
+    """Test that a circuit with parameters of different interfaces on different operators is
+    converted without warnings or errors."""
+    import torch
+
+    ops = [qml.RX(qml.numpy.array(0.5), 0), qml.RY(torch.tensor(1.2), 1), qml.CNOT((0, 1))]
+    m = [qml.expval(qml.PauliZ(0))]
+    qs = qml.tape.QuantumScript(ops, m)
+
+    new_qs = convert_to_numpy_parameters(qs)
+
+    assert len(recwarn) == 0
+    for new_op, op in zip(new_qs.operations, qs.operations):
+        assert qml.math.get_interface(*new_op.data) == "numpy"
+        assert qml.equal(new_op, op, check_interface=False, check_trainability=False)
+
+
+@pytest.mark.autograd
+def test_parameter_free_components_not_copied():
+    """Test that only components with non-numpy parameters are converted, and that the
+    original circuit is left unchanged."""
+    ops = [qml.RX(qml.numpy.array(0.5), 0), qml.CNOT((0, 1)), qml.Hadamard(1)]
+    m = [qml.expval(qml.PauliZ(0)), qml.probs(wires=1)]
+    qs = qml.tape.QuantumScript(ops, m)
+
+    new_qs = convert_to_numpy_parameters(qs)
+
+    assert qml.math.get_interface(*new_qs.get_parameters(trainable_only=False)) == "numpy"
+    assert qml.math.get_interface(*qs.get_parameters(trainable_only=False)) == "autograd"
+    assert new_qs[0] is not qs[0]
+    for ind in (1, 2, 3, 4):
+        assert new_qs[ind] is qs[ind]
+
+
+@pytest.mark.autograd
+def test_all_component_parameters_unwrapped():
+    """Test that the parameters of operators, state preparations and observables, including
+    tensor observables, are all converted to numpy without modifying the original circuit."""
+    mat = qml.numpy.eye(2)
+    ops = [qml.RX(qml.numpy.array(0.5), 0), qml.Rot(*qml.numpy.array([0.1, 0.2, 0.3]), 1)]
+    obs = qml.operation.Tensor(qml.PauliZ(0), qml.Hermitian(mat, 1))
+    m = [qml.expval(obs), qml.expval(qml.Hermitian(mat, 0))]
+    prep = [qml.QubitStateVector(qml.numpy.array([0.0, 1.0]), 0)]
+    qs = qml.tape.QuantumScript(ops, m, prep)
+
+    new_qs = convert_to_numpy_parameters(qs)
+
+    assert qml.math.get_interface(*new_qs.get_parameters(trainable_only=False)) == "numpy"
+    assert qml.math.get_interface(*qs.get_parameters(trainable_only=False)) == "autograd"
+    for new_op, op in zip(new_qs.operations + new_qs.observables, qs.operations + qs.observables):
+        assert qml.math.get_interface(*new_op.data) == "numpy"
+        assert qml.equal(new_op, op, check_interface=False, check_trainability=False)
+
+
 @pytest.mark.autograd
 def test_preserves_trainable_params():
     """Test that convert_to_numpy_parameters preserves the trainable parameters property."""
@@ -111,3 +184,10 @@ def test_unwraps_tensor_observables():
 
     unwrapped_m = _convert_measurement_to_numpy_data(m)
     assert qml.math.get_interface(*unwrapped_m.obs.data) == "numpy"
+
+
+def test_parameter_free_tensor_observable_not_copied():
+    """Test that a measurement of a tensor observable without parameters is left uncopied."""
+    m = qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+    assert _convert_measurement_to_numpy_data(m) is m
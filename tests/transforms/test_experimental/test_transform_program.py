@@ -112,6 +112,18 @@ class TestTransformProgram:
         assert transform_program.is_empty()
         assert transform_container is transform1
 
+    def test_pop_front_order(self):
+        """Test that popping the front of the transform program returns the transforms in order."""
+        transform_program = TransformProgram()
+        containers = [TransformContainer(transform=first_valid_transform) for _ in range(5)]
+        for container in containers:
+            transform_program.push_back(container)
+
+        for container in containers:
+            assert transform_program.pop_front() is container
+
+        assert transform_program.is_empty()
+
     def test_insert_front(self):
         """Test to insert a transform at the beginning of a transform program."""
         transform_program = TransformProgram()
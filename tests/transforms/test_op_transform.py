@@ -50,6 +50,20 @@ class TestValidation:
         ):
             qml.op_transform(5)
 
+    def test_signature_inspected_lazily(self, mocker):
+        """Test that the signature of the operator function is only inspected when needed,
+        and only once"""
+        spy = mocker.spy(qml.transforms.op_transforms.inspect, "signature")
+
+        @qml.op_transform
+        def my_transform(op, wire_order=None):
+            return op.name
+
+        assert spy.call_count == 0
+        assert "wire_order" in my_transform._sig
+        assert "wire_order" in my_transform._sig
+        assert spy.call_count == 1
+
     def test_unknown_object(self):
         """Test that an error is raised if the transform
         is applied to an unknown object"""